@@ -5,8 +5,28 @@ from pathlib import Path
 from random import Random
 from typing import List, Tuple
 
+from app.dataset_io import DATASET_SUFFIX, load_dataset
 from app.logic.sampling import ParameterBounds, create_group
 from app.models import Group, Vector2
+from app.point_import import IMPORT_SUFFIXES, ImportFields, ImportProgress, import_points
+
+DEFAULT_POINT_COUNT = 10
+DEFAULT_CIRCLE_RADIUS = 120.0
+
+
+def load_board(
+    path: Path,
+    rng: Random,
+    fields: ImportFields = ImportFields(),
+    on_progress: ImportProgress | None = None,
+) -> Tuple[List[Group], ParameterBounds, float, bool]:
+    suffix = path.suffix.lower()
+    if suffix == DATASET_SUFFIX:
+        return (*load_dataset(path), False)
+    if suffix in IMPORT_SUFFIXES:
+        groups = import_points(path, fields, on_progress=on_progress)
+        return groups, _parse_bounds({}), DEFAULT_CIRCLE_RADIUS, False
+    return (*load_configuration(path, rng), True)
 
 
 def load_configuration(
@@ -16,8 +36,9 @@ def load_configuration(
     with path.open("r", encoding="utf-8") as handle:
         data = json.load(handle)
     bounds = _parse_bounds(data)
-    circle_radius = float(data.get("circle_radius", 120.0))
-    groups = [_build_group(entry, rng) for entry in data.get("groups", [])]
+    circle_radius = float(data.get("circle_radius", DEFAULT_CIRCLE_RADIUS))
+    point_count = int(data.get("point_count", DEFAULT_POINT_COUNT))
+    groups = [_build_group(entry, rng, point_count) for entry in data.get("groups", [])]
     return groups, bounds, circle_radius
 
 
@@ -32,12 +53,15 @@ def _parse_bounds(data: dict) -> ParameterBounds:
     )
 
 
-def _build_group(entry: dict, rng: Random) -> Group:
+def _build_group(entry: dict, rng: Random, default_point_count: int) -> Group:
     group_id = entry["id"]
     color = entry["color"]
     mean = _parse_vector(entry["mean"])
     variance = _parse_vector(entry["variance"])
-    return create_group(group_id, color, mean, variance, rng)
+    point_count = int(entry.get("point_count", default_point_count))
+    if point_count < 0:
+        raise ValueError(f"Group {group_id} has a negative point_count.")
+    return create_group(group_id, color, mean, variance, rng, point_count)
 
 
 def _parse_vector(source) -> Vector2:
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import os
+import struct
+import tempfile
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.logic.sampling import ParameterBounds
+from app.models import AppState, Group, GroupStats, PointStore
+
+DATASET_SUFFIX = ".ppd"
+MAGIC = b"PPDS"
+FORMAT_VERSION = 1
+PREAMBLE = struct.Struct("<4sHHQ")
+ALIGNMENT = 64
+COLUMNS = (("positions", "<f8", 2), ("labels", "<i4", 1), ("overlap", "|b1", 1), ("indices", "<i4", 1))
+
+
+def save_dataset(
+    path: Path, state: AppState, bounds: ParameterBounds, circle_radius: float
+) -> None:
+    groups = state.groups
+    names = list(dict.fromkeys(name for group in groups for name in group.points.names))
+    lookup = {name: index for index, name in enumerate(names)}
+    total = sum(len(group.points) for group in groups)
+    header = {
+        "count": total,
+        "names": names,
+        "circle_radius": circle_radius,
+        "bounds": {key: list(value) for key, value in asdict(bounds).items()},
+        "groups": _group_headers(groups),
+        "columns": {},
+    }
+    offset = 0
+    for column, dtype, width in COLUMNS:
+        header["columns"][column] = {"dtype": dtype, "offset": offset}
+        offset = _aligned(offset + total * width * np.dtype(dtype).itemsize)
+    encoded = json.dumps(header).encode("utf-8")
+    data_start = _aligned(PREAMBLE.size + len(encoded))
+    descriptor, temporary = tempfile.mkstemp(prefix=f".{path.name}.", dir=path.parent)
+    try:
+        with os.fdopen(descriptor, "wb") as handle:
+            handle.write(PREAMBLE.pack(MAGIC, FORMAT_VERSION, 0, len(encoded)))
+            handle.write(encoded)
+            for column, dtype, _ in COLUMNS:
+                handle.seek(data_start + header["columns"][column]["offset"])
+                for group in groups:
+                    _column(group.points, column, lookup).astype(dtype, copy=False).tofile(handle)
+            handle.truncate(data_start + offset)
+        os.replace(temporary, path)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def load_dataset(path: Path) -> Tuple[List[Group], ParameterBounds, float]:
+    with path.open("rb") as handle:
+        magic, version, _, header_length = PREAMBLE.unpack(handle.read(PREAMBLE.size))
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a version {FORMAT_VERSION} points dataset.")
+        header = json.loads(handle.read(header_length).decode("utf-8"))
+    data_start = _aligned(PREAMBLE.size + header_length)
+    raw = np.memmap(path, dtype=np.uint8, mode="c")
+    total = header["count"]
+    columns: Dict[str, np.ndarray] = {}
+    for column, dtype, width in COLUMNS:
+        start = data_start + header["columns"][column]["offset"]
+        size = total * width * np.dtype(dtype).itemsize
+        values = raw[start : start + size].view(dtype)
+        columns[column] = values.reshape(total, 2) if width == 2 else values
+    names = tuple(header["names"])
+    groups = [_build_group(entry, columns, names) for entry in header["groups"]]
+    bounds = ParameterBounds(**{key: tuple(value) for key, value in header["bounds"].items()})
+    return groups, bounds, float(header["circle_radius"])
+
+
+def _group_headers(groups: Sequence[Group]) -> List[dict]:
+    entries = []
+    start = 0
+    for group in groups:
+        stop = start + len(group.points)
+        stats = group.stats
+        entries.append(
+            {
+                "id": group.id,
+                "color": group.color,
+                "mean": list(group.mean),
+                "variance": list(group.variance),
+                "center": list(group.center_position),
+                "start": start,
+                "stop": stop,
+                "stats": asdict(stats),
+            }
+        )
+        start = stop
+    return entries
+
+
+def _build_group(entry: dict, columns: Dict[str, np.ndarray], names: Tuple[str, ...]) -> Group:
+    rows = slice(entry["start"], entry["stop"])
+    points = PointStore(
+        columns["positions"][rows],
+        columns["labels"][rows],
+        columns["overlap"][rows],
+        columns["indices"][rows],
+        names,
+    )
+    group = Group(
+        id=entry["id"],
+        color=entry["color"],
+        mean=tuple(entry["mean"]),
+        variance=tuple(entry["variance"]),
+        points=points,
+        center_position=tuple(entry["center"]),
+    )
+    stats = dict(entry["stats"])
+    stats["origin"] = tuple(stats["origin"])
+    group.stats = GroupStats(**stats)
+    return group
+
+
+def _column(points: PointStore, column: str, lookup: Dict[str, int]) -> np.ndarray:
+    if column == "labels":
+        return np.array([lookup[name] for name in points.names], dtype=np.int32)[points.labels]
+    return getattr(points, column)
+
+
+def _aligned(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+
+from app.logic import kmeans_engine
+from app.logic.convergence import CenterShift, ConvergenceMonitor
+
+SLACK = 1e-9
+
+
+def hamerly(
+    positions: np.ndarray,
+    centers: np.ndarray,
+    max_iterations: int = 30,
+    epsilon: float = 1.0,
+    evaluations: List[int] | None = None,
+    on_iteration: kmeans_engine.IterationCallback | None = None,
+    monitor: ConvergenceMonitor | None = None,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    count = len(positions)
+    monitor = monitor or ConvergenceMonitor(count, (CenterShift(epsilon),))
+    labels = np.zeros(count, dtype=np.intp)
+    upper = np.zeros(count, dtype=np.float64)
+    lower = np.zeros(count, dtype=np.float64)
+    for iteration in range(max_iterations):
+        if iteration == 0:
+            rows, tightened = np.arange(count), 0
+        else:
+            rows, tightened = _stale_rows(positions, centers, labels, upper, lower)
+        new_labels, upper[rows], lower[rows] = _nearest_two(positions[rows], centers)
+        reassigned = count if iteration == 0 else int(np.count_nonzero(new_labels != labels[rows]))
+        labels[rows] = new_labels
+        sse = kmeans_engine.within_variance(positions, centers, labels) if monitor.needs_sse else np.nan
+        if evaluations is not None:
+            evaluations.append(tightened + len(rows) * len(centers))
+        new_centers = kmeans_engine.recenter(positions, labels, len(centers))
+        movement = np.sqrt(((new_centers - centers) ** 2).sum(axis=1))
+        _loosen_bounds(labels, upper, lower, movement)
+        shift = float(movement.sum())
+        centers = new_centers
+        if on_iteration is not None:
+            on_iteration(iteration, shift)
+        if monitor.update(iteration, sse, shift, reassigned) or not reassigned:
+            break
+    return centers, labels, kmeans_engine.within_variance(positions, centers, labels)
+
+
+def _stale_rows(
+    positions: np.ndarray,
+    centers: np.ndarray,
+    labels: np.ndarray,
+    upper: np.ndarray,
+    lower: np.ndarray,
+) -> Tuple[np.ndarray, int]:
+    separation = np.sqrt(kmeans_engine.squared_distances(centers, centers))
+    np.fill_diagonal(separation, np.inf)
+    bound = np.maximum(0.5 * separation.min(axis=1)[labels], lower) * (1.0 - SLACK) - SLACK
+    rows = np.flatnonzero(upper >= bound)
+    offsets = positions[rows] - centers[labels[rows]]
+    upper[rows] = np.sqrt((offsets * offsets).sum(axis=1))
+    keep = upper[rows] >= bound[rows]
+    return rows[keep], len(rows)
+
+
+def _nearest_two(
+    positions: np.ndarray, centers: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    labels = np.empty(len(positions), dtype=np.intp)
+    nearest = np.empty(len(positions), dtype=np.float64)
+    second = np.full(len(positions), np.inf)
+    step = kmeans_engine.CHUNK_SIZE
+    for start in range(0, len(positions), step):
+        distances = kmeans_engine.squared_distances(positions[start : start + step], centers)
+        block = slice(start, start + len(distances))
+        labels[block] = distances.argmin(axis=1)
+        nearest[block] = distances[np.arange(len(distances)), labels[block]]
+        if len(centers) > 1:
+            second[block] = np.partition(distances, 1, axis=1)[:, 1]
+    return labels, np.sqrt(nearest), np.sqrt(second)
+
+
+def _loosen_bounds(
+    labels: np.ndarray, upper: np.ndarray, lower: np.ndarray, movement: np.ndarray
+) -> None:
+    upper += movement[labels]
+    if len(movement) < 2:
+        return
+    order = np.argsort(movement)
+    largest, runner_up = movement[order[-1]], movement[order[-2]]
+    lower -= np.where(labels == order[-1], runner_up, largest)
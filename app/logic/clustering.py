@@ -1,9 +1,38 @@
 from __future__ import annotations
 
-import math
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
 from typing import Dict, List, Sequence, Tuple
 
-from app.models import Point, Vector2
+import numpy as np
+
+from app.logic import kmeans_engine
+from app.logic.accelerated_kmeans import hamerly
+from app.logic.convergence import CenterShift, ConvergenceMonitor, IterationStats, StoppingPolicy
+from app.logic.minibatch_kmeans import run_minibatch_kmeans
+from app.models import Point, PointStore, Vector2
+
+INIT_CENTERS = "centers"
+INIT_KMEANS_PLUS_PLUS = "k-means++"
+ENGINE_LLOYD = "lloyd"
+ENGINE_MINIBATCH = "minibatch"
+ENGINE_HAMERLY = "hamerly"
+LABEL_DTYPE = np.int32
+
+
+@dataclass(frozen=True)
+class KMeansOptions:
+    init: str = INIT_CENTERS
+    n_init: int = 1
+    workers: int | None = None
+    engine: str = ENGINE_LLOYD
+    batch_size: int = 1024
+    stopping: Tuple[StoppingPolicy, ...] = ()
+
+    @property
+    def is_randomized(self) -> bool:
+        return self.init == INIT_KMEANS_PLUS_PLUS or self.n_init > 1 or self.engine == ENGINE_MINIBATCH
 
 
 def run_kmeans(
@@ -11,89 +40,96 @@ def run_kmeans(
     initial_centers: Sequence[Vector2] | None = None,
     max_iterations: int = 30,
     epsilon: float = 1.0,
-) -> Tuple[List[Vector2], Dict[str, int], float]:
+    options: KMeansOptions | None = None,
+    seed: int | None = None,
+    n_clusters: int = 3,
+    on_iteration: kmeans_engine.IterationCallback | None = None,
+    trace: List[IterationStats] | None = None,
+    record_sse: bool | None = None,
+) -> Tuple[List[Vector2], np.ndarray, float]:
     if len(points) < 3:
         raise ValueError("K-means requires at least three points.")
-    centers = list(initial_centers) if initial_centers else _default_centers(points)
-    assignments: Dict[str, int] = {}
-    for _ in range(max_iterations):
-        changed = _assign_points(points, centers, assignments)
-        new_centers = _recenter(points, assignments, len(centers))
-        shift = _total_shift(centers, new_centers)
-        centers = new_centers
-        if not changed or shift < epsilon:
-            break
-    score = _total_within_variance(points, centers, assignments)
-    return centers, assignments, score
-
-
-def _default_centers(points: Sequence[Point]) -> List[Vector2]:
-    unique = list({point.id: point for point in points}.values())
-    if len(unique) < 3:
-        raise ValueError("Insufficient unique points for centers.")
-    return [unique[i].position for i in range(3)]
-
-
-def _assign_points(
-    points: Sequence[Point],
-    centers: Sequence[Vector2],
-    assignments: Dict[str, int],
-) -> bool:
-    changed = False
-    for point in points:
-        index = _closest_center(point.position, centers)
-        if assignments.get(point.id) != index:
-            assignments[point.id] = index
-            changed = True
-    return changed
-
-
-def _recenter(
-    points: Sequence[Point],
-    assignments: Dict[str, int],
-    center_count: int,
-) -> List[Vector2]:
-    totals = [(0.0, 0.0, 0) for _ in range(center_count)]
-    for point in points:
-        index = assignments.get(point.id, 0)
-        total_x, total_y, total_count = totals[index]
-        totals[index] = (
-            total_x + point.position[0],
-            total_y + point.position[1],
-            total_count + 1,
+    options = options or KMeansOptions()
+    centers = list(initial_centers) if initial_centers else _default_centers(points, n_clusters)
+    positions = _positions(points)
+    restarts = _restart_plan(np.array(centers, dtype=np.float64), options, seed)
+    if record_sse is None:
+        record_sse = trace is not None
+    run = partial(_run_restart, positions, len(centers), max_iterations, epsilon, record_sse, options, on_iteration)
+    if len(restarts) == 1:
+        results = [run(restarts[0])]
+    else:
+        with ThreadPoolExecutor(options.workers) as pool:
+            results = list(pool.map(run, restarts))
+    final_centers, labels, score, iterations = min(results, key=lambda result: result[2])
+    if trace is not None:
+        trace.extend(iterations)
+    return [(x, y) for x, y in final_centers.tolist()], labels.astype(LABEL_DTYPE, copy=False), score
+
+
+def assignments_by_id(points: Sequence[Point], labels: np.ndarray) -> Dict[str, int]:
+    return dict(zip(_point_ids(points), labels.tolist()))
+
+
+def _run_restart(
+    positions: np.ndarray,
+    count: int,
+    max_iterations: int,
+    epsilon: float,
+    record_sse: bool,
+    options: KMeansOptions,
+    on_iteration: kmeans_engine.IterationCallback | None,
+    start: Tuple[np.ndarray | None, np.random.SeedSequence],
+) -> Tuple[np.ndarray, np.ndarray, float, List[IterationStats]]:
+    centers, seed_sequence = start
+    rng = np.random.default_rng(seed_sequence)
+    if centers is None:
+        centers = kmeans_engine.kmeans_plus_plus(positions, count, rng)
+    policies = options.stopping
+    if not policies and options.engine != ENGINE_MINIBATCH:
+        policies = (CenterShift(epsilon),)
+    monitor = ConvergenceMonitor(len(positions), policies, record_sse)
+    if options.engine == ENGINE_MINIBATCH:
+        result = run_minibatch_kmeans(
+            positions,
+            centers,
+            options.batch_size,
+            max_passes=max_iterations,
+            rng=rng,
+            on_iteration=on_iteration,
+            monitor=monitor,
         )
-    new_centers: List[Vector2] = []
-    for total_x, total_y, total_count in totals:
-        if total_count == 0:
-            new_centers.append((0.0, 0.0))
-        else:
-            new_centers.append((total_x / total_count, total_y / total_count))
-    return new_centers
+    elif options.engine == ENGINE_HAMERLY:
+        result = hamerly(positions, centers, max_iterations, on_iteration=on_iteration, monitor=monitor)
+    else:
+        result = kmeans_engine.lloyd(positions, centers, max_iterations, on_iteration=on_iteration, monitor=monitor)
+    return (*result, monitor.trace)
 
 
-def _closest_center(point: Vector2, centers: Sequence[Vector2]) -> int:
-    distances = [
-        (index, _distance_squared(point, center)) for index, center in enumerate(centers)
-    ]
-    return min(distances, key=lambda item: item[1])[0]
+def _restart_plan(
+    centers: np.ndarray, options: KMeansOptions, seed: int | None
+) -> List[Tuple[np.ndarray | None, np.random.SeedSequence]]:
+    sequences = np.random.SeedSequence(seed).spawn(max(1, options.n_init))
+    if options.init == INIT_KMEANS_PLUS_PLUS:
+        return [(None, sequence) for sequence in sequences]
+    return [(centers, sequences[0])] + [(None, sequence) for sequence in sequences[1:]]
 
 
-def _distance_squared(a: Vector2, b: Vector2) -> float:
-    return (a[0] - b[0]) ** 2 + (a[1] - b[1]) ** 2
+def _default_centers(points: Sequence[Point], count: int = 3) -> List[Vector2]:
+    unique = list({point_id: row for row, point_id in enumerate(_point_ids(points))}.values())
+    if len(unique) < count:
+        raise ValueError("Insufficient unique points for centers.")
+    positions = _positions(points)
+    return [(positions[row, 0].item(), positions[row, 1].item()) for row in unique[:count]]
 
 
-def _total_shift(previous: Sequence[Vector2], current: Sequence[Vector2]) -> float:
-    total = 0.0
-    for before, after in zip(previous, current):
-        total += math.sqrt(_distance_squared(before, after))
-    return total
+def _point_ids(points: Sequence[Point]) -> List[str]:
+    if isinstance(points, PointStore):
+        return points.ids()
+    return [point.id for point in points]
 
 
-def _total_within_variance(
-    points: Sequence[Point], centers: Sequence[Vector2], assignments: Dict[str, int]
-) -> float:
-    total = 0.0
-    for point in points:
-        center = centers[assignments.get(point.id, 0)]
-        total += _distance_squared(point.position, center)
-    return total
+def _positions(points: Sequence[Point]) -> np.ndarray:
+    if isinstance(points, PointStore):
+        return points.positions
+    return np.array([point.position for point in points], dtype=np.float64).reshape(-1, 2)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Protocol, Sequence, Tuple
+
+
+@dataclass(frozen=True)
+class IterationStats:
+    iteration: int
+    sse: float
+    shift: float
+    reassigned: int
+    seconds: float
+
+
+class StoppingPolicy(Protocol):
+    needs_sse: bool
+
+    def should_stop(self, trace: Sequence[IterationStats], point_count: int) -> bool: ...
+
+
+@dataclass(frozen=True)
+class CenterShift:
+    epsilon: float = 1.0
+    needs_sse = False
+
+    def should_stop(self, trace: Sequence[IterationStats], point_count: int) -> bool:
+        return trace[-1].shift < self.epsilon
+
+
+@dataclass(frozen=True)
+class RelativeImprovement:
+    tolerance: float = 1e-4
+    needs_sse = True
+
+    def should_stop(self, trace: Sequence[IterationStats], point_count: int) -> bool:
+        if len(trace) < 2:
+            return False
+        previous, current = trace[-2].sse, trace[-1].sse
+        if math.isnan(previous) or math.isnan(current):
+            return False
+        return previous == 0.0 or (previous - current) / previous < self.tolerance
+
+
+@dataclass(frozen=True)
+class ReassignmentFraction:
+    fraction: float = 1e-3
+    needs_sse = False
+
+    def should_stop(self, trace: Sequence[IterationStats], point_count: int) -> bool:
+        reassigned = trace[-1].reassigned
+        return len(trace) > 1 and 0 <= reassigned <= self.fraction * point_count
+
+
+@dataclass(frozen=True)
+class TimeBudget:
+    seconds: float = 1.0
+    needs_sse = False
+
+    def should_stop(self, trace: Sequence[IterationStats], point_count: int) -> bool:
+        return trace[-1].seconds >= self.seconds
+
+
+STOP_CENTER_SHIFT = "center-shift"
+STOP_RELATIVE_SSE = "relative-sse"
+STOP_REASSIGNMENT = "reassignment"
+STOP_TIME_BUDGET = "time-budget"
+
+STOPPING_PRESETS: Dict[str, Tuple[StoppingPolicy, ...]] = {
+    STOP_CENTER_SHIFT: (),
+    STOP_RELATIVE_SSE: (RelativeImprovement(1e-4),),
+    STOP_REASSIGNMENT: (ReassignmentFraction(1e-3),),
+    STOP_TIME_BUDGET: (TimeBudget(1.0),),
+}
+
+
+class ConvergenceMonitor:
+    def __init__(self, point_count: int, policies: Sequence[StoppingPolicy], record_sse: bool = False) -> None:
+        self.point_count = point_count
+        self.policies = tuple(policies)
+        self.needs_sse = record_sse or any(policy.needs_sse for policy in self.policies)
+        self.trace: List[IterationStats] = []
+        self._started = time.perf_counter()
+
+    def update(self, iteration: int, sse: float, shift: float, reassigned: int) -> bool:
+        seconds = time.perf_counter() - self._started
+        self.trace.append(IterationStats(iteration, sse, shift, reassigned, seconds))
+        return any(policy.should_stop(self.trace, self.point_count) for policy in self.policies)
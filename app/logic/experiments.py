@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import csv
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, fields
+from functools import partial
+from pathlib import Path
+from random import Random
+from typing import List
+
+import numpy as np
+
+from app.config_loader import load_board
+from app.logic.state_manager import StateManager
+
+
+@dataclass(frozen=True)
+class RunResult:
+    run: int
+    seed: int
+    cycle: int
+    group_id: str
+    score: float
+    percent: float
+    v_measure: float
+    ari: float
+    nmi: float
+
+
+@dataclass(frozen=True)
+class BatchSummary:
+    runs: int
+    cycles: int
+    seconds: float
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.seconds if self.seconds > 0 else 0.0
+
+
+def run_seeds(base_seed: int, runs: int) -> List[int]:
+    return np.random.SeedSequence(base_seed).generate_state(runs).tolist()
+
+
+def run_experiment(config_path: Path, cycles: int, run: int, seed: int) -> List[RunResult]:
+    rng = Random(seed)
+    groups, bounds, circle_radius, generated = load_board(config_path, rng)
+    manager = StateManager(
+        groups=groups,
+        parameter_bounds=bounds,
+        overlap_radius=circle_radius,
+        rng=rng,
+        jitter_overlap=generated,
+    )
+    results: List[RunResult] = []
+    for cycle in range(cycles):
+        group_id = manager.rng.choice(manager.state.groups).id
+        manager.regenerate_group(group_id)
+        _, _, score, percent, v_measure, ari, nmi = manager.compute_kmeans()
+        manager.apply_kmeans()
+        results.append(RunResult(run, seed, cycle, group_id, score, percent, v_measure, ari, nmi))
+    return results
+
+
+def run_batch(
+    config_path: Path,
+    output_path: Path,
+    runs: int,
+    cycles: int,
+    base_seed: int = 0,
+    workers: int | None = None,
+) -> BatchSummary:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    seeds = run_seeds(base_seed, runs)
+    worker = partial(run_experiment, config_path, cycles)
+    started = time.perf_counter()
+    with output_path.open("w", newline="", encoding="utf-8") as handle, ProcessPoolExecutor(workers) as pool:
+        writer = csv.DictWriter(handle, fieldnames=[field.name for field in fields(RunResult)])
+        writer.writeheader()
+        for results in pool.map(worker, range(runs), seeds, chunksize=max(1, runs // 64)):
+            writer.writerows(asdict(result) for result in results)
+    return BatchSummary(runs=runs, cycles=cycles, seconds=time.perf_counter() - started)
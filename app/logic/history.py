@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, replace
+from typing import Hashable, Iterator, List, Sequence, Set, Tuple
+
+import numpy as np
+
+from app.models import Group, PointStore
+
+DEFAULT_MAX_STEPS = 100
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    label: str
+    groups: Tuple[Group, ...]
+    applied_score: float | None
+    ground_truth: np.ndarray
+    overlap_enabled: bool
+
+
+class History:
+    def __init__(self, max_steps: int = DEFAULT_MAX_STEPS, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.max_steps = max_steps
+        self.max_bytes = max_bytes
+        self._undo: List[Snapshot] = []
+        self._redo: List[Snapshot] = []
+        self._merge_key: Hashable | None = None
+
+    @property
+    def can_undo(self) -> bool:
+        return bool(self._undo)
+
+    @property
+    def can_redo(self) -> bool:
+        return bool(self._redo)
+
+    def push(self, snapshot: Snapshot, merge_key: Hashable | None = None) -> bool:
+        if merge_key is not None and merge_key == self._merge_key and self._undo:
+            return False
+        self._merge_key = merge_key
+        self._redo.clear()
+        self._undo.append(snapshot)
+        return True
+
+    def seal(self) -> None:
+        self._merge_key = None
+
+    def undo(self, current: Snapshot) -> Snapshot | None:
+        return self._step(self._undo, self._redo, current)
+
+    def redo(self, current: Snapshot) -> Snapshot | None:
+        return self._step(self._redo, self._undo, current)
+
+    def trim(self, current: Snapshot) -> None:
+        redo, undo = self._overheads(current)
+        total = sum(redo) + sum(undo)
+        while self._undo and (len(self._undo) > self.max_steps or total > self.max_bytes):
+            self._undo.pop(0)
+            total -= undo.pop(0)
+
+    def steps(self, current: Snapshot) -> List[Tuple[str, int]]:
+        _, undo = self._overheads(current)
+        return [(snapshot.label, nbytes) for snapshot, nbytes in zip(self._undo, undo)]
+
+    def nbytes(self, current: Snapshot) -> int:
+        redo, undo = self._overheads(current)
+        return sum(redo) + sum(undo)
+
+    def _step(self, source: List[Snapshot], target: List[Snapshot], current: Snapshot) -> Snapshot | None:
+        if not source:
+            return None
+        self._merge_key = None
+        snapshot = source.pop()
+        target.append(replace(current, label=snapshot.label))
+        return snapshot
+
+    def _overheads(self, current: Snapshot) -> Tuple[List[int], List[int]]:
+        seen: Set[int] = {id(array) for array in _arrays(current)}
+        return _unshared(self._redo, seen), _unshared(self._undo, seen)
+
+
+def detach(group: Group) -> Group:
+    points = group.points
+    stats = group.stats
+    store = PointStore(points.positions.copy(), points.labels, points.overlap, points.indices, points.names)
+    copy = replace(group, points=store)
+    copy.stats = replace(stats)
+    return copy
+
+
+def _unshared(stack: Sequence[Snapshot], seen: Set[int]) -> List[int]:
+    overheads = []
+    for snapshot in reversed(stack):
+        nbytes = 0
+        for array in _arrays(snapshot):
+            if id(array) not in seen:
+                seen.add(id(array))
+                nbytes += array.nbytes
+        overheads.append(nbytes)
+    overheads.reverse()
+    return overheads
+
+
+def _arrays(snapshot: Snapshot) -> Iterator[np.ndarray]:
+    yield snapshot.ground_truth
+    for group in snapshot.groups:
+        points = group.points
+        yield from (points.positions, points.labels, points.overlap, points.indices)
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import Callable, Tuple
+
+import numpy as np
+
+from app.logic.convergence import CenterShift, ConvergenceMonitor
+
+CHUNK_SIZE = 65536
+
+IterationCallback = Callable[[int, float], None]
+
+
+def lloyd(
+    positions: np.ndarray,
+    centers: np.ndarray,
+    max_iterations: int = 30,
+    epsilon: float = 1.0,
+    on_iteration: IterationCallback | None = None,
+    monitor: ConvergenceMonitor | None = None,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    monitor = monitor or ConvergenceMonitor(len(positions), (CenterShift(epsilon),))
+    labels = np.zeros(len(positions), dtype=np.intp)
+    for iteration in range(max_iterations):
+        new_labels, nearest = assign_nearest(positions, centers)
+        reassigned = len(positions) if iteration == 0 else int(np.count_nonzero(new_labels != labels))
+        labels = new_labels
+        new_centers = recenter(positions, labels, len(centers))
+        shift = total_shift(centers, new_centers)
+        centers = new_centers
+        if on_iteration is not None:
+            on_iteration(iteration, shift)
+        if monitor.update(iteration, float(nearest.sum()), shift, reassigned) or not reassigned:
+            break
+    return centers, labels, within_variance(positions, centers, labels)
+
+
+def assign(positions: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    labels = np.empty(len(positions), dtype=np.intp)
+    for start in range(0, len(positions), CHUNK_SIZE):
+        block = positions[start : start + CHUNK_SIZE]
+        labels[start : start + len(block)] = squared_distances(block, centers).argmin(axis=1)
+    return labels
+
+
+def assign_nearest(positions: np.ndarray, centers: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    labels = np.empty(len(positions), dtype=np.intp)
+    nearest = np.empty(len(positions), dtype=np.float64)
+    for start in range(0, len(positions), CHUNK_SIZE):
+        distances = squared_distances(positions[start : start + CHUNK_SIZE], centers)
+        block = slice(start, start + len(distances))
+        labels[block] = distances.argmin(axis=1)
+        nearest[block] = distances[np.arange(len(distances)), labels[block]]
+    return labels, nearest
+
+
+def squared_distances(positions: np.ndarray, centers: np.ndarray) -> np.ndarray:
+    dx = positions[:, 0, np.newaxis] - centers[np.newaxis, :, 0]
+    dy = positions[:, 1, np.newaxis] - centers[np.newaxis, :, 1]
+    return dx * dx + dy * dy
+
+
+def recenter(positions: np.ndarray, labels: np.ndarray, center_count: int) -> np.ndarray:
+    counts = np.bincount(labels, minlength=center_count)
+    totals_x = np.bincount(labels, weights=positions[:, 0], minlength=center_count)
+    totals_y = np.bincount(labels, weights=positions[:, 1], minlength=center_count)
+    centers = np.zeros((center_count, 2), dtype=np.float64)
+    filled = counts > 0
+    centers[filled, 0] = totals_x[filled] / counts[filled]
+    centers[filled, 1] = totals_y[filled] / counts[filled]
+    return centers
+
+
+def total_shift(previous: np.ndarray, current: np.ndarray) -> float:
+    return float(np.sqrt(((current - previous) ** 2).sum(axis=1)).sum())
+
+
+def within_variance(positions: np.ndarray, centers: np.ndarray, labels: np.ndarray) -> float:
+    offsets = positions - centers[labels]
+    return float((offsets * offsets).sum())
+
+
+def kmeans_plus_plus(positions: np.ndarray, count: int, rng: np.random.Generator) -> np.ndarray:
+    centers = np.empty((count, 2), dtype=np.float64)
+    centers[0] = positions[rng.integers(len(positions))]
+    closest = squared_distances(positions, centers[:1])[:, 0]
+    for index in range(1, count):
+        cumulative = np.cumsum(closest)
+        total = cumulative[-1]
+        if total > 0:
+            row = int(np.searchsorted(cumulative, rng.random() * total, side="right"))
+            row = min(row, len(positions) - 1)
+        else:
+            row = int(rng.integers(len(positions)))
+        centers[index] = positions[row]
+        np.minimum(closest, squared_distances(positions, centers[index : index + 1])[:, 0], out=closest)
+    return centers
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from hashlib import blake2b
+from typing import Callable, List, Tuple
+
+import numpy as np
+
+from app.logic import kmeans_engine, metrics
+from app.logic.clustering import KMeansOptions, run_kmeans
+from app.logic.convergence import IterationStats
+from app.logic.kmeans_engine import IterationCallback
+from app.logic.profiling import span
+from app.models import PointStore, Vector2
+
+PREVIEW_ITERATIONS = 3
+PREVIEW_SAMPLE = 16_384
+
+
+class KMeansCancelled(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class KMeansSnapshot:
+    version: int
+    points: PointStore
+    initial_centers: List[Vector2]
+    baseline_labels: np.ndarray
+    applied_score: float | None
+    options: KMeansOptions
+    seed: int | None
+    fingerprint: bytes = b""
+
+
+@dataclass(frozen=True)
+class KMeansResult:
+    version: int
+    centers: List[Vector2]
+    labels: np.ndarray
+    score: float
+    percent: float
+    v_measure: float
+    ari: float
+    nmi: float
+    trace: Tuple[IterationStats, ...] = ()
+    fingerprint: bytes = b""
+
+    @property
+    def nbytes(self) -> int:
+        return self.labels.nbytes + 64 * len(self.trace)
+
+
+@dataclass(frozen=True)
+class PreviewSnapshot:
+    version: int
+    positions: np.ndarray
+    centers: np.ndarray
+
+
+@dataclass(frozen=True)
+class PreviewResult:
+    version: int
+    centers: List[Vector2]
+    shift: float
+
+
+def fingerprint(
+    points: PointStore,
+    initial_centers: List[Vector2],
+    baseline_labels: np.ndarray,
+    applied_score: float | None,
+    options: KMeansOptions,
+    seed: int | None,
+) -> bytes:
+    digest = blake2b(digest_size=16)
+    for array in (points.positions, points.labels, points.indices, baseline_labels):
+        digest.update(np.ascontiguousarray(array).data)
+    digest.update(repr((points.names, initial_centers, applied_score, options, seed)).encode("utf-8"))
+    return digest.digest()
+
+
+def run_job(
+    snapshot: KMeansSnapshot,
+    on_iteration: IterationCallback | None = None,
+    is_cancelled: Callable[[], bool] | None = None,
+) -> KMeansResult:
+    def report(iteration: int, shift: float) -> None:
+        if is_cancelled is not None and is_cancelled():
+            raise KMeansCancelled()
+        if on_iteration is not None:
+            on_iteration(iteration, shift)
+
+    points = snapshot.points
+    trace: List[IterationStats] = []
+    with span("kmeans.run"):
+        centers, labels, score = run_kmeans(
+            points,
+            snapshot.initial_centers,
+            options=snapshot.options,
+            seed=snapshot.seed,
+            on_iteration=report,
+            trace=trace,
+            record_sse=False,
+        )
+    if is_cancelled is not None and is_cancelled():
+        raise KMeansCancelled()
+    baseline = snapshot.applied_score if snapshot.applied_score is not None else score
+    percent = 0.0 if baseline == 0 else ((baseline - score) / baseline) * 100.0
+    with span("kmeans.metrics"):
+        scores = metrics.clustering_scores(snapshot.baseline_labels, labels)
+    return KMeansResult(
+        version=snapshot.version,
+        centers=centers,
+        labels=labels,
+        score=score,
+        percent=percent,
+        v_measure=scores.v_measure * 100.0,
+        ari=scores.ari * 100.0,
+        nmi=scores.nmi * 100.0,
+        trace=tuple(trace),
+        fingerprint=snapshot.fingerprint,
+    )
+
+
+def run_preview(snapshot: PreviewSnapshot, iterations: int = PREVIEW_ITERATIONS, epsilon: float = 1.0) -> PreviewResult:
+    positions, centers, shift = snapshot.positions, snapshot.centers, 0.0
+    with span("kmeans.preview"):
+        for _ in range(iterations):
+            labels = kmeans_engine.assign(positions, centers)
+            updated = kmeans_engine.recenter(positions, labels, len(centers))
+            empty = np.bincount(labels, minlength=len(centers)) == 0
+            updated[empty] = centers[empty]
+            shift, centers = kmeans_engine.total_shift(centers, updated), updated
+            if shift < epsilon:
+                break
+    return PreviewResult(snapshot.version, [(x, y) for x, y in centers.tolist()], shift)
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class ClusteringScores:
+    homogeneity: float
+    completeness: float
+    v_measure: float
+    ari: float
+    nmi: float
+
+
+def clustering_scores(truth: Sequence[int], predicted: Sequence[int]) -> ClusteringScores:
+    table = contingency_matrix(truth, predicted)
+    if table.size == 0:
+        return ClusteringScores(0.0, 0.0, 0.0, 0.0, 0.0)
+    return scores_from_contingency(table)
+
+
+def contingency_matrix(truth: Sequence[int], predicted: Sequence[int]) -> np.ndarray:
+    classes = _dense_labels(np.asarray(truth))
+    clusters = _dense_labels(np.asarray(predicted))
+    if classes.size == 0:
+        return np.zeros((0, 0), dtype=np.int64)
+    width = int(clusters.max()) + 1
+    flat = np.bincount(classes * width + clusters, minlength=(int(classes.max()) + 1) * width)
+    return flat.reshape(-1, width)
+
+
+def scores_from_contingency(table: np.ndarray) -> ClusteringScores:
+    total = float(table.sum())
+    class_counts = table.sum(axis=1)
+    cluster_counts = table.sum(axis=0)
+    h_class = _entropy(class_counts, total)
+    h_cluster = _entropy(cluster_counts, total)
+    rows, cols = np.nonzero(table)
+    joint = table[rows, cols].astype(np.float64)
+    h_class_given_cluster = -float((joint / total * np.log(joint / cluster_counts[cols])).sum())
+    h_cluster_given_class = -float((joint / total * np.log(joint / class_counts[rows])).sum())
+    mutual_info = float(
+        (joint / total * np.log(joint * total / (class_counts[rows] * cluster_counts[cols]))).sum()
+    )
+    homogeneity = 1.0 if h_class == 0 else 1.0 - h_class_given_cluster / h_class
+    completeness = 1.0 if h_cluster == 0 else 1.0 - h_cluster_given_class / h_cluster
+    harmonic = homogeneity + completeness
+    v_measure = 0.0 if harmonic == 0 else 2 * homogeneity * completeness / harmonic
+    denominator = h_class + h_cluster
+    nmi = 0.0 if denominator == 0 else 2 * mutual_info / denominator
+    return ClusteringScores(homogeneity, completeness, v_measure, _adjusted_rand_index(table), nmi)
+
+
+def _adjusted_rand_index(table: np.ndarray) -> float:
+    sum_comb_class = _sum_pairs(table.sum(axis=1))
+    sum_comb_cluster = _sum_pairs(table.sum(axis=0))
+    sum_comb_joint = _sum_pairs(table)
+    total_pairs = _sum_pairs(np.array([table.sum()]))
+    if total_pairs == 0:
+        return 0.0
+    cross = sum_comb_class * sum_comb_cluster
+    numerator = 2 * (total_pairs * sum_comb_joint - cross)
+    denominator = total_pairs * (sum_comb_class + sum_comb_cluster) - 2 * cross
+    if denominator == 0:
+        return 0.0
+    return numerator / denominator
+
+
+def _sum_pairs(counts: np.ndarray) -> int:
+    counts = counts.astype(np.int64).ravel()
+    return sum(count * (count - 1) // 2 for count in counts.tolist())
+
+
+def _entropy(counts: np.ndarray, total: float) -> float:
+    probabilities = counts[counts > 0] / total
+    return -float((probabilities * np.log(probabilities)).sum())
+
+
+def _dense_labels(labels: np.ndarray) -> np.ndarray:
+    labels = labels.ravel()
+    if labels.size and labels.dtype.kind in "iu" and labels.min() >= 0 and labels.max() < 4 * labels.size:
+        present = np.bincount(labels) > 0
+        return (np.cumsum(present) - 1)[labels]
+    return np.unique(labels, return_inverse=True)[1].astype(np.int64).ravel()
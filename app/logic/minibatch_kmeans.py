@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import Callable, Iterable, Iterator, Tuple
+
+import numpy as np
+
+from app.logic import kmeans_engine
+from app.logic.convergence import ConvergenceMonitor
+
+ChunkSource = Callable[[], Iterable[np.ndarray]]
+
+
+def run_minibatch_kmeans(
+    source: ChunkSource | np.ndarray,
+    initial_centers: np.ndarray,
+    batch_size: int = 1024,
+    max_passes: int = 30,
+    window: int = 10,
+    tolerance: float = 1e-3,
+    rng: np.random.Generator | None = None,
+    on_iteration: kmeans_engine.IterationCallback | None = None,
+    monitor: ConvergenceMonitor | None = None,
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    rng = rng or np.random.default_rng()
+    final_source = source
+    if isinstance(source, np.ndarray):
+        final_source = lambda positions=source: [positions]
+        source = _shuffled_chunks(source, batch_size, rng)
+    centers = np.array(initial_centers, dtype=np.float64)
+    checkpoint = centers.copy()
+    counts = np.zeros(len(centers), dtype=np.int64)
+    recent: deque[float] = deque(maxlen=window)
+    best = np.inf
+    stale = 0
+    step = 0
+    for _ in range(max_passes):
+        for batch in _batches(source(), batch_size):
+            recent.append(_update(centers, counts, batch))
+            step += 1
+            if len(recent) < window:
+                continue
+            windowed = sum(recent) / window
+            if windowed < best * (1.0 - tolerance):
+                best, stale = windowed, 0
+            else:
+                stale += 1
+            if step % window == 0:
+                shift = kmeans_engine.total_shift(checkpoint, centers)
+                checkpoint[:] = centers
+                if on_iteration is not None:
+                    on_iteration(step, shift)
+                if monitor is not None and monitor.update(step, windowed * (monitor.point_count or 1), shift, -1):
+                    return _finalize(final_source(), centers)
+            if stale >= window:
+                return _finalize(final_source(), centers)
+    return _finalize(final_source(), centers)
+
+
+def _update(centers: np.ndarray, counts: np.ndarray, batch: np.ndarray) -> float:
+    distances = kmeans_engine.squared_distances(batch, centers)
+    labels = distances.argmin(axis=1)
+    batch_counts = np.bincount(labels, minlength=len(centers))
+    touched = batch_counts > 0
+    counts += batch_counts
+    for axis in range(2):
+        totals = np.bincount(labels, weights=batch[:, axis], minlength=len(centers))
+        means = totals[touched] / batch_counts[touched]
+        rates = batch_counts[touched] / counts[touched]
+        centers[touched, axis] += rates * (means - centers[touched, axis])
+    return float(distances[np.arange(len(batch)), labels].mean())
+
+
+def _finalize(
+    chunks: Iterable[np.ndarray], centers: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    labels = []
+    score = 0.0
+    for chunk in chunks:
+        chunk = np.asarray(chunk, dtype=np.float64).reshape(-1, 2)
+        chunk_labels = kmeans_engine.assign(chunk, centers)
+        score += kmeans_engine.within_variance(chunk, centers, chunk_labels)
+        labels.append(chunk_labels)
+    return centers, np.concatenate(labels) if labels else np.empty(0, dtype=np.intp), score
+
+
+def _batches(chunks: Iterable[np.ndarray], batch_size: int) -> Iterator[np.ndarray]:
+    pending = []
+    pending_rows = 0
+    for chunk in chunks:
+        pending.append(np.asarray(chunk, dtype=np.float64).reshape(-1, 2))
+        pending_rows += len(pending[-1])
+        if pending_rows < batch_size:
+            continue
+        merged = np.concatenate(pending) if len(pending) > 1 else pending[0]
+        full = pending_rows - pending_rows % batch_size
+        for start in range(0, full, batch_size):
+            yield merged[start : start + batch_size]
+        pending = [merged[full:]]
+        pending_rows = len(pending[0])
+    if pending_rows:
+        yield np.concatenate(pending)
+
+
+def _shuffled_chunks(
+    positions: np.ndarray, batch_size: int, rng: np.random.Generator
+) -> ChunkSource:
+    def chunks() -> Iterator[np.ndarray]:
+        order = rng.permutation(len(positions))
+        for start in range(0, len(positions), batch_size):
+            yield positions[order[start : start + batch_size]]
+
+    return chunks
@@ -2,46 +2,103 @@ from __future__ import annotations
 
 import math
 from random import Random
-from typing import Iterable, List, Sequence
+from typing import List, Sequence
 
-from app.models import Group, Point, Vector2
+import numpy as np
+
+from app.models import Group, Vector2
 
 OVERLAP_COUNT = 3
+JITTER_FRACTION = 0.3
 
 
 def enforce_overlap(groups: Sequence[Group], radius: float, rng: Random) -> None:
-    if not groups:
+    OverlapEngine(radius).reset(groups, rng)
+
+
+class OverlapEngine:
+    def __init__(self, radius: float) -> None:
+        self.jitter_radius = radius * JITTER_FRACTION
+        self._total: Vector2 = (0.0, 0.0)
+        self._count = 0
+
+    @property
+    def center(self) -> Vector2:
+        if not self._count:
+            return 0.0, 0.0
+        return self._total[0] / self._count, self._total[1] / self._count
+
+    def sync(self, groups: Sequence[Group]) -> None:
+        self._total = (
+            sum(group.center_position[0] for group in groups),
+            sum(group.center_position[1] for group in groups),
+        )
+        self._count = len(groups)
+
+    def reset(self, groups: Sequence[Group], rng: Random) -> None:
+        self.sync(groups)
+        center = self.center
+        for group in groups:
+            _jitter_overlap(group, center, self.jitter_radius, rng)
+
+    def group_moved(self, groups: Sequence[Group], group_id: str, delta: Vector2) -> List[str]:
+        shift = self._shift_center(delta)
+        for group in groups:
+            if group.id == group_id:
+                _translate_overlap(group, shift[0] - delta[0], shift[1] - delta[1])
+            else:
+                _translate_overlap(group, *shift)
+        return [group.id for group in groups]
+
+    def group_replaced(
+        self, groups: Sequence[Group], group_id: str, previous_center: Vector2, rng: Random
+    ) -> List[str]:
+        replaced = next(group for group in groups if group.id == group_id)
+        delta = (
+            replaced.center_position[0] - previous_center[0],
+            replaced.center_position[1] - previous_center[1],
+        )
+        shift = self._shift_center(delta)
+        _jitter_overlap(replaced, self.center, self.jitter_radius, rng)
+        if shift == (0.0, 0.0):
+            return [group_id]
+        for group in groups:
+            if group is not replaced:
+                _translate_overlap(group, *shift)
+        return [group.id for group in groups]
+
+    def _shift_center(self, delta: Vector2) -> Vector2:
+        self._total = (self._total[0] + delta[0], self._total[1] + delta[1])
+        if not self._count:
+            return 0.0, 0.0
+        return delta[0] / self._count, delta[1] / self._count
+
+
+def jitter_offsets(count: int, radius: float, rng: Random) -> np.ndarray:
+    generator = np.random.default_rng(rng.getrandbits(64))
+    angles = generator.uniform(0.0, 2.0 * math.pi, count)
+    distances = generator.uniform(0.0, radius, count)
+    return np.column_stack((np.cos(angles) * distances, np.sin(angles) * distances))
+
+
+def _jitter_overlap(group: Group, center: Vector2, jitter_radius: float, rng: Random) -> None:
+    points = group.points
+    stats = group.stats
+    count = min(OVERLAP_COUNT, len(points))
+    before = points.positions[:count].copy()
+    overlap = np.zeros(len(points), dtype=bool)
+    overlap[:count] = True
+    points.overlap = overlap
+    points.positions[:count] = np.asarray(center) + jitter_offsets(count, jitter_radius, rng)
+    stats.replace(before, points.positions[:count])
+
+
+def _translate_overlap(group: Group, dx: float, dy: float) -> None:
+    if dx == 0.0 and dy == 0.0:
         return
-    center = _compute_overlap_center(groups)
-    jitter_radius = radius * 0.3
-    for group in groups:
-        _mark_overlap_points(group.points, center, jitter_radius, rng)
-
-
-def _mark_overlap_points(
-    points: List[Point], center: Vector2, jitter_radius: float, rng: Random
-) -> None:
-    for index, point in enumerate(points):
-        if index < OVERLAP_COUNT:
-            angle = rng.uniform(0.0, 2.0 * math.pi)
-            distance = rng.uniform(0.0, jitter_radius)
-            point.position = (
-                center[0] + math.cos(angle) * distance,
-                center[1] + math.sin(angle) * distance,
-            )
-            point.is_overlap = True
-        else:
-            point.is_overlap = False
-
-
-def _compute_overlap_center(groups: Iterable[Group]) -> Vector2:
-    total_x = 0.0
-    total_y = 0.0
-    count = 0
-    for group in groups:
-        total_x += group.center_position[0]
-        total_y += group.center_position[1]
-        count += 1
-    if count == 0:
-        return 0.0, 0.0
-    return total_x / count, total_y / count
+    points = group.points
+    stats = group.stats
+    overlap = points.positions[: min(OVERLAP_COUNT, len(points))]
+    before = overlap.copy()
+    overlap += (dx, dy)
+    stats.replace(before, overlap)
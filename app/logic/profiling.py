@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Callable, ContextManager, Deque, Dict, Iterator, Tuple, TypeVar
+
+import numpy as np
+
+ROLLING_WINDOW = 512
+PERCENTILES = (50, 90, 99)
+
+F = TypeVar("F", bound=Callable)
+
+_DISABLED = nullcontext()
+
+
+class Profiler:
+    def __init__(self, enabled: bool = False, window: int = ROLLING_WINDOW) -> None:
+        self.enabled = enabled
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples: Dict[str, Deque[Tuple[float, float]]] = {}
+        self._counts: Dict[str, int] = {}
+
+    def span(self, name: str) -> ContextManager[None]:
+        if not self.enabled:
+            return _DISABLED
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - started)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append((time.perf_counter(), seconds))
+            self._counts[name] = self._counts.get(name, 0) + 1
+
+    def last_ms(self, name: str) -> float | None:
+        samples = self._samples.get(name)
+        return samples[-1][1] * 1000.0 if samples else None
+
+    def rate(self, name: str, horizon: float = 1.0) -> float:
+        samples = self._samples.get(name)
+        if not samples:
+            return 0.0
+        cutoff = time.perf_counter() - horizon
+        return sum(1 for ended, _ in samples if ended >= cutoff) / horizon
+
+    def summary(self) -> Dict[str, dict]:
+        with self._lock:
+            series = {name: [seconds for _, seconds in samples] for name, samples in self._samples.items()}
+            counts = dict(self._counts)
+        report = {}
+        for name, seconds in sorted(series.items()):
+            values = np.array(seconds) * 1000.0
+            entry = {"count": counts[name], "last_ms": float(values[-1]), "max_ms": float(values.max())}
+            for percentile, value in zip(PERCENTILES, np.percentile(values, PERCENTILES).tolist()):
+                entry[f"p{percentile}_ms"] = value
+            report[name] = entry
+        return report
+
+    def dump(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"window": self.window, "spans": self.summary()}
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples.clear()
+            self._counts.clear()
+
+
+PROFILER = Profiler()
+
+
+def span(name: str) -> ContextManager[None]:
+    return PROFILER.span(name)
+
+
+def profiled(name: str) -> Callable[[F], F]:
+    def decorate(func: F) -> F:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
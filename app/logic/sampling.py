@@ -3,9 +3,11 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 from random import Random
-from typing import List, Tuple
+from typing import Tuple
 
-from app.models import Group, Point, Vector2
+import numpy as np
+
+from app.models import Group, PointStore, Vector2
 
 
 @dataclass(frozen=True)
@@ -61,20 +63,11 @@ def regenerate_group(group: Group, mean: Vector2, variance: Vector2, rng: Random
 
 def _sample_points(
     group_id: str, mean: Vector2, variance: Vector2, rng: Random, count: int
-) -> List[Point]:
+) -> PointStore:
     deviation = (
         math.sqrt(max(variance[0], 1e-6)),
         math.sqrt(max(variance[1], 1e-6)),
     )
-    points: List[Point] = []
-    for index in range(count):
-        x = rng.gauss(mean[0], deviation[0])
-        y = rng.gauss(mean[1], deviation[1])
-        points.append(
-            Point(
-                id=f"{group_id}-{index}",
-                position=(x, y),
-                original_group_id=group_id,
-            )
-        )
-    return points
+    generator = np.random.default_rng(rng.getrandbits(64))
+    positions = generator.normal(mean, deviation, size=(count, 2))
+    return PointStore.from_positions(group_id, positions)
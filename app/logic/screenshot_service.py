@@ -1,15 +1,99 @@
 from __future__ import annotations
 
+import queue
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Protocol, Set, Tuple
 
-from PyQt6.QtWidgets import QWidget
+DROP_OLDEST = "drop_oldest"
+BLOCK = "block"
 
 
-def save_widget_screenshot(widget: QWidget, output_dir: Path) -> Path:
-    output_dir.mkdir(parents=True, exist_ok=True)
-    pixmap = widget.grab()
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    path = output_dir / f"kmeans_{timestamp}.png"
-    pixmap.save(str(path), "PNG")
+class SavableImage(Protocol):
+    def save(self, path: str, fmt: str, quality: int) -> bool: ...
+
+
+def unique_screenshot_path(output_dir: Path, reserved: Set[Path] | None = None) -> Path:
+    stamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    path = output_dir / f"kmeans_{stamp}.png"
+    suffix = 1
+    while path.exists() or (reserved is not None and path in reserved):
+        path = output_dir / f"kmeans_{stamp}_{suffix}.png"
+        suffix += 1
     return path
+
+
+class ScreenshotWriter:
+    def __init__(
+        self,
+        output_dir: Path,
+        max_pending: int = 4,
+        compression_level: int | None = None,
+        policy: str = DROP_OLDEST,
+    ) -> None:
+        if policy not in (DROP_OLDEST, BLOCK):
+            raise ValueError(f"Unknown backpressure policy {policy!r}.")
+        self.output_dir = output_dir
+        self.policy = policy
+        self.quality = -1 if compression_level is None else round((9 - compression_level) * 100 / 9)
+        self.dropped = 0
+        self.written = 0
+        self.failed = 0
+        self._queue: queue.Queue[Tuple[SavableImage, Path] | None] = queue.Queue(max_pending)
+        self._reserved: Set[Path] = set()
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name="screenshot-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, image: SavableImage) -> Path:
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            path = unique_screenshot_path(self.output_dir, self._reserved)
+            self._reserved.add(path)
+        if self.policy == BLOCK:
+            self._queue.put((image, path))
+            return path
+        while True:
+            try:
+                self._queue.put_nowait((image, path))
+                return path
+            except queue.Full:
+                self._discard_oldest()
+
+    def flush(self) -> None:
+        self._queue.join()
+
+    def close(self) -> None:
+        if not self._thread.is_alive():
+            return
+        self.flush()
+        self._queue.put(None)
+        self._thread.join()
+
+    def _discard_oldest(self) -> None:
+        try:
+            _, path = self._queue.get_nowait()
+        except queue.Empty:
+            return
+        with self._lock:
+            self._reserved.discard(path)
+        self.dropped += 1
+        self._queue.task_done()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            image, path = item
+            try:
+                if image.save(str(path), "PNG", self.quality):
+                    self.written += 1
+                else:
+                    self.failed += 1
+            finally:
+                with self._lock:
+                    self._reserved.discard(path)
+                self._queue.task_done()
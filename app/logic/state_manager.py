@@ -1,13 +1,21 @@
 from __future__ import annotations
 
-import math
+from dataclasses import replace
+from pathlib import Path
 from random import Random
-from typing import Dict, List, Tuple
+from typing import List, Sequence, Tuple
 
-from app.logic import overlap_manager, sampling
+import numpy as np
+
+from app.dataset_io import save_dataset
+from app.logic import kmeans_job, overlap_manager, sampling
 from app.logic.kmeans_apply import apply_assignments
-from app.logic.clustering import run_kmeans
-from app.models import AppState, Group, Point, Vector2
+from app.logic.clustering import KMeansOptions
+from app.logic.convergence import IterationStats
+from app.logic.history import History, Snapshot, detach
+from app.logic.profiling import profiled
+from app.logic.result_cache import ResultCache
+from app.models import AppState, Group, PointStore, Vector2
 
 
 class StateManager:
@@ -17,14 +25,25 @@ class StateManager:
         parameter_bounds: sampling.ParameterBounds,
         overlap_radius: float,
         rng: Random,
+        jitter_overlap: bool = True,
     ) -> None:
         self.bounds = parameter_bounds
         self.overlap_radius = overlap_radius
         self.rng = rng
         self.state = AppState(groups=list(groups))
-        self._pending_assignments: Dict[str, int] | None = None
-        self._overlap_enabled = True
-        overlap_manager.enforce_overlap(self.state.groups, overlap_radius, rng)
+        self._pending_labels: np.ndarray | None = None
+        self.convergence_trace: Tuple[IterationStats, ...] = ()
+        self.kmeans_cache: ResultCache[kmeans_job.KMeansResult] = ResultCache()
+        self.kmeans_options = KMeansOptions()
+        self.history = History()
+        self._owned: List[Group] = []
+        self.version = 0
+        self._touch(*(group.id for group in self.state.groups))
+        self.overlap = overlap_manager.OverlapEngine(overlap_radius)
+        if jitter_overlap:
+            self.overlap.reset(self.state.groups, rng)
+        else:
+            self.overlap.sync(self.state.groups)
         self._overlap_enabled = False
         self._last_score: float | None = None
         self._applied_score: float | None = self._current_score()
@@ -37,55 +56,190 @@ class StateManager:
         self.state.seed = seed
         self.rng = Random(seed) if seed is not None else Random()
 
+    def set_kmeans_options(self, options: KMeansOptions) -> None:
+        self.kmeans_options = options
+
+    def set_overlap_enabled(self, enabled: bool) -> None:
+        if enabled and not self._overlap_enabled:
+            self._checkpoint("enable overlap")
+            self.overlap.reset(self._overlap_groups(), self.rng)
+            self._touch(*(group.id for group in self.state.groups))
+            self._overlap_enabled = True
+            self.history.trim(self._capture())
+        self._overlap_enabled = enabled
+
+    @profiled("state.move_group")
     def move_group(self, group_id: str, delta: Vector2) -> None:
-        group = self._require_group(group_id)
-        dx, dy = delta
-        group.center_position = (group.center_position[0] + dx, group.center_position[1] + dy)
-        for point in group.points:
-            point.position = (point.position[0] + dx, point.position[1] + dy)
+        self._require_group(group_id)
+        recorded = self._checkpoint(f"move {group_id}", ("move", group_id))
+        group = self._owned_group(group_id)
+        group.translate(*delta)
+        changed = [group_id]
+        if self._overlap_enabled:
+            changed = self.overlap.group_moved(self._overlap_groups(), group_id, delta)
         group.mean = group.center_position
-        group.variance = self._variance(group.center_position, group.points)
-        self._enforce_overlap_if_enabled()
+        group.variance = group.stats.spread(group.center_position)
+        self._touch(*changed)
+        if recorded:
+            self.history.trim(self._capture())
 
+    @profiled("state.regenerate_group")
     def regenerate_group(self, group_id: str) -> None:
         group = self._require_group(group_id)
+        self._checkpoint(f"regenerate {group_id}")
         mean, variance = sampling.random_parameters(self.bounds, self.rng)
         variance = self._amplify_variance(variance)
         updated = sampling.regenerate_group(group, mean, variance, self.rng)
         self._replace_group(updated)
-        self._enforce_overlap_if_enabled()
+        self._owned.append(updated)
+        changed = [group_id]
+        if self._overlap_enabled:
+            changed = self.overlap.group_replaced(self._overlap_groups(), group_id, group.center_position, self.rng)
+        self._touch(*changed)
+        self.history.trim(self._capture())
 
-    def compute_kmeans(self) -> Tuple[List[Vector2], Dict[str, int], float, float, float, float, float]:
-        points = self._all_points()
+    def compute_kmeans(self) -> Tuple[List[Vector2], np.ndarray, float, float, float, float, float]:
+        snapshot = self.snapshot_kmeans()
+        result = self.cached_kmeans(snapshot) or kmeans_job.run_job(snapshot)
+        self.accept_kmeans(result)
+        return (
+            result.centers,
+            result.labels,
+            result.score,
+            result.percent,
+            result.v_measure,
+            result.ari,
+            result.nmi,
+        )
+
+    @profiled("kmeans.snapshot")
+    def snapshot_kmeans(self, warm_start: Sequence[Vector2] | None = None) -> kmeans_job.KMeansSnapshot:
         truth_labels = self._ground_truth_labels
-        baseline_labels = truth_labels if truth_labels else self._current_cluster_labels()
-        initial_centers = [group.center_position for group in self.state.groups]
-        centers, assignments, score = run_kmeans(points, initial_centers)
-        self.state.pending_kmeans = centers
-        self._pending_assignments = assignments
-        baseline = self._applied_score if self._applied_score is not None else score
-        percent = 0.0 if baseline == 0 else ((baseline - score) / baseline) * 100.0
-        predicted_labels = [assignments.get(point.id, 0) for point in points]
-        v_measure = self._v_measure(baseline_labels, predicted_labels) * 100.0
-        ari = self._adjusted_rand_index(baseline_labels, predicted_labels) * 100.0
-        nmi = self._normalized_mutual_info(baseline_labels, predicted_labels) * 100.0
-        self._last_score = score
-        return centers, assignments, score, percent, v_measure, ari, nmi
+        points = self._all_points()
+        initial_centers = self._initial_centers(warm_start)
+        baseline_labels = truth_labels if len(truth_labels) else self._current_cluster_labels()
+        options = self.kmeans_options
+        seed = self.state.seed if options.is_randomized else None
+        key = kmeans_job.fingerprint(points, initial_centers, baseline_labels, self._applied_score, options, seed)
+        if options.is_randomized:
+            seed = int.from_bytes(key[:4], "little") if seed is not None else self.rng.getrandbits(32)
+            key = key if self.state.seed is not None else b""
+        return kmeans_job.KMeansSnapshot(
+            version=self.version,
+            points=points,
+            initial_centers=initial_centers,
+            baseline_labels=baseline_labels,
+            applied_score=self._applied_score,
+            options=options,
+            seed=seed,
+            fingerprint=key,
+        )
+
+    def snapshot_preview(self, sample: int = kmeans_job.PREVIEW_SAMPLE) -> kmeans_job.PreviewSnapshot:
+        groups = self.state.groups
+        stride = max(1, -(-sum(len(group.points) for group in groups) // sample))
+        positions = np.concatenate([group.points.positions[::stride] for group in groups])
+        centers = np.array(self._initial_centers(self.state.pending_kmeans), dtype=np.float64)
+        return kmeans_job.PreviewSnapshot(self.version, positions, centers)
+
+    def preview_kmeans(self, result: kmeans_job.PreviewResult) -> None:
+        self.state.pending_kmeans = result.centers
+        self._pending_labels = None
 
+    def cached_kmeans(self, snapshot: kmeans_job.KMeansSnapshot) -> kmeans_job.KMeansResult | None:
+        cached = self.kmeans_cache.get(snapshot.fingerprint)
+        return None if cached is None else replace(cached, version=snapshot.version)
+
+    def accept_kmeans(self, result: kmeans_job.KMeansResult) -> bool:
+        if result.version != self.version:
+            return False
+        if result.fingerprint and result.fingerprint not in self.kmeans_cache:
+            self.kmeans_cache.put(result.fingerprint, result, result.nbytes)
+        self.state.pending_kmeans = result.centers
+        self._pending_labels = result.labels
+        self.convergence_trace = result.trace
+        self._last_score = result.score
+        return True
+
+    @profiled("state.apply_kmeans")
     def apply_kmeans(self) -> None:
-        if not self._pending_assignments:
+        if self._pending_labels is None:
             return
+        self._checkpoint("apply k-means")
         centers = self.state.pending_kmeans
-        self.state.groups = apply_assignments(self.state.groups, centers, self._pending_assignments)
-        self._enforce_overlap_if_enabled()
+        previous = self.state.groups
+        self.state.groups = apply_assignments(previous, centers, self._pending_labels)
+        self._owned.extend(group for group in self.state.groups if all(group is not old for old in previous))
+        if self._overlap_enabled:
+            self.overlap.reset(self._overlap_groups(), self.rng)
         self.state.pending_kmeans = []
-        self._pending_assignments = None
+        self._pending_labels = None
         self._applied_score = self._last_score if self._last_score is not None else self._current_score()
         self._ground_truth_labels = self._current_cluster_labels()
         self._last_score = None
+        self._touch(*(group.id for group in self.state.groups))
+        self.history.trim(self._capture())
+
+    def end_interaction(self) -> None:
+        self.history.seal()
 
-    def _all_points(self) -> List[Point]:
-        return [point for group in self.state.groups for point in group.points]
+    def undo(self) -> str | None:
+        return self._restore(self.history.undo(self._capture()))
+
+    def redo(self) -> str | None:
+        return self._restore(self.history.redo(self._capture()))
+
+    def history_steps(self) -> List[Tuple[str, int]]:
+        return self.history.steps(self._capture())
+
+    def history_nbytes(self) -> int:
+        return self.history.nbytes(self._capture())
+
+    def save_dataset(self, path: Path) -> None:
+        save_dataset(path, self.state, self.bounds, self.overlap_radius)
+
+    def _all_points(self) -> PointStore:
+        return PointStore.concat([group.points for group in self.state.groups])
+
+    def _initial_centers(self, warm_start: Sequence[Vector2] | None) -> List[Vector2]:
+        if warm_start and len(warm_start) == len(self.state.groups):
+            return list(warm_start)
+        return [group.center_position for group in self.state.groups]
+
+    def _capture(self, label: str = "") -> Snapshot:
+        groups = tuple(self.state.groups)
+        return Snapshot(label, groups, self._applied_score, self._ground_truth_labels, self._overlap_enabled)
+
+    def _checkpoint(self, label: str, merge_key: Tuple[str, str] | None = None) -> bool:
+        if not self.history.push(self._capture(label), merge_key):
+            return False
+        self._owned.clear()
+        return True
+
+    def _owned_group(self, group_id: str) -> Group:
+        group = self._require_group(group_id)
+        if any(owned is group for owned in self._owned):
+            return group
+        copy = detach(group)
+        self._replace_group(copy)
+        self._owned.append(copy)
+        return copy
+
+    def _restore(self, snapshot: Snapshot | None) -> str | None:
+        if snapshot is None:
+            return None
+        previous = {group.id: group for group in self.state.groups}
+        self.state.groups = list(snapshot.groups)
+        self._applied_score = snapshot.applied_score
+        self._ground_truth_labels = snapshot.ground_truth
+        self._overlap_enabled = snapshot.overlap_enabled
+        self.state.pending_kmeans = []
+        self._pending_labels = None
+        self._last_score = None
+        self._owned.clear()
+        self.overlap.sync(self.state.groups)
+        self._touch(*(group.id for group in snapshot.groups if previous.get(group.id) is not group))
+        return snapshot.label
 
     def _replace_group(self, replacement: Group) -> None:
         for index, group in enumerate(self.state.groups):
@@ -100,19 +254,13 @@ class StateManager:
                 return group
         raise KeyError(f"Group {group_id} not found.")
 
-    @staticmethod
-    def _variance(center: Vector2, points: List[Point]) -> Vector2:
-        if not points:
-            return (0.0, 0.0)
-        count = float(len(points))
-        return (
-            sum((point.position[0] - center[0]) ** 2 for point in points) / count,
-            sum((point.position[1] - center[1]) ** 2 for point in points) / count,
-        )
+    def _touch(self, *group_ids: str) -> None:
+        self.version += 1
+        for group_id in group_ids:
+            self.state.group_versions[group_id] = self.version
 
-    def _enforce_overlap_if_enabled(self) -> None:
-        if self._overlap_enabled:
-            overlap_manager.enforce_overlap(self.state.groups, self.overlap_radius, self.rng)
+    def _overlap_groups(self) -> List[Group]:
+        return [self._owned_group(group.id) for group in list(self.state.groups)]
 
     def _amplify_variance(self, variance: Vector2) -> Vector2:
         def adjust(value: float, min_val: float, max_val: float) -> float:
@@ -130,133 +278,10 @@ class StateManager:
     def _current_score(self) -> float:
         total = 0.0
         for group in self.state.groups:
-            mean = group.mean
-            for point in group.points:
-                total += (point.position[0] - mean[0]) ** 2 + (point.position[1] - mean[1]) ** 2
+            x, y = group.stats.squared_deviation(group.mean)
+            total += x + y
         return total
 
-    def _current_cluster_labels(self) -> List[int]:
-        label_map = {group.id: index for index, group in enumerate(self.state.groups)}
-        labels: List[int] = []
-        for group in self.state.groups:
-            label = label_map[group.id]
-            for _ in group.points:
-                labels.append(label)
-        return labels
-
-    def _v_measure(self, truth: List[int], predicted: List[int]) -> float:
-        if not truth:
-            return 0.0
-        cluster_counts: Dict[int, Dict[int, int]] = {}
-        class_counts: Dict[int, int] = {}
-        for t, p in zip(truth, predicted):
-            class_counts[t] = class_counts.get(t, 0) + 1
-            group_counts = cluster_counts.setdefault(p, {})
-            group_counts[t] = group_counts.get(t, 0) + 1
-
-        total_points = float(len(truth))
-        h_c = self._entropy(class_counts.values(), total_points)
-        h_k = self._entropy(
-            (sum(group_counts.values()) for group_counts in cluster_counts.values()),
-            total_points,
-        )
-        h_c_given_k = self._conditional_entropy(cluster_counts, total_points)
-        h_k_given_c = self._conditional_entropy_by_class(cluster_counts, class_counts, total_points)
-
-        homogeneity = 1.0 if h_c == 0 else 1.0 - h_c_given_k / h_c
-        completeness = 1.0 if h_k == 0 else 1.0 - h_k_given_c / h_k
-        if homogeneity + completeness == 0:
-            return 0.0
-        return 2 * homogeneity * completeness / (homogeneity + completeness)
-
-    def _adjusted_rand_index(self, truth: List[int], predicted: List[int]) -> float:
-        if not truth:
-            return 0.0
-        class_counts: Dict[int, int] = {}
-        cluster_counts: Dict[int, int] = {}
-        contingency: Dict[Tuple[int, int], int] = {}
-        for t, p in zip(truth, predicted):
-            class_counts[t] = class_counts.get(t, 0) + 1
-            cluster_counts[p] = cluster_counts.get(p, 0) + 1
-            key = (p, t)
-            contingency[key] = contingency.get(key, 0) + 1
-
-        def comb2(value: int) -> float:
-            return value * (value - 1) / 2.0
-
-        sum_comb_c = sum(comb2(value) for value in class_counts.values())
-        sum_comb_k = sum(comb2(value) for value in cluster_counts.values())
-        sum_comb_cont = sum(comb2(value) for value in contingency.values())
-        total_pairs = comb2(len(truth))
-        if total_pairs == 0:
-            return 0.0
-        expected_index = (sum_comb_c * sum_comb_k) / total_pairs
-        max_index = (sum_comb_c + sum_comb_k) / 2.0
-        if max_index == expected_index:
-            return 0.0
-        return (sum_comb_cont - expected_index) / (max_index - expected_index)
-
-    def _normalized_mutual_info(self, truth: List[int], predicted: List[int]) -> float:
-        if not truth:
-            return 0.0
-        class_counts: Dict[int, int] = {}
-        cluster_counts: Dict[int, int] = {}
-        contingency: Dict[Tuple[int, int], int] = {}
-        for t, p in zip(truth, predicted):
-            class_counts[t] = class_counts.get(t, 0) + 1
-            cluster_counts[p] = cluster_counts.get(p, 0) + 1
-            key = (p, t)
-            contingency[key] = contingency.get(key, 0) + 1
-        total_points = float(len(truth))
-        mutual_info = 0.0
-        for (cluster, cls), value in contingency.items():
-            if value == 0:
-                continue
-            mutual_info += (value / total_points) * math.log(
-                (value * total_points) / (cluster_counts[cluster] * class_counts[cls])
-            )
-        h_cluster = self._entropy(cluster_counts.values(), total_points)
-        h_class = self._entropy(class_counts.values(), total_points)
-        denominator = h_cluster + h_class
-        if denominator == 0:
-            return 0.0
-        return (2 * mutual_info) / denominator
-
-    @staticmethod
-    def _entropy(counts, total: float) -> float:
-        entropy = 0.0
-        for count in counts:
-            if count == 0:
-                continue
-            prob = count / total
-            entropy -= prob * math.log(prob)
-        return entropy
-
-    @staticmethod
-    def _conditional_entropy(cluster_counts: Dict[int, Dict[str, int]], total: float) -> float:
-        entropy = 0.0
-        for counts in cluster_counts.values():
-            cluster_total = sum(counts.values())
-            if cluster_total == 0:
-                continue
-            weight = cluster_total / total
-            entropy += weight * StateManager._entropy(counts.values(), cluster_total)
-        return entropy
-
-    @staticmethod
-    def _conditional_entropy_by_class(
-        cluster_counts: Dict[int, Dict[str, int]],
-        class_counts: Dict[str, int],
-        total: float,
-    ) -> float:
-        entropy = 0.0
-        class_totals = class_counts
-        for class_id, class_total in class_totals.items():
-            if class_total == 0:
-                continue
-            weight = class_total / total
-            cluster_distribution = []
-            for counts in cluster_counts.values():
-                cluster_distribution.append(counts.get(class_id, 0))
-            entropy += weight * StateManager._entropy(cluster_distribution, class_total)
-        return entropy
+    def _current_cluster_labels(self) -> np.ndarray:
+        counts = [len(group.points) for group in self.state.groups]
+        return np.repeat(np.arange(len(counts), dtype=np.intp), counts)
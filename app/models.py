@@ -1,5 +1,9 @@
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.point_store import PointStore
 
 Vector2 = Tuple[float, float]
 
@@ -12,14 +16,87 @@ class Point:
     is_overlap: bool = False
 
 
+@dataclass
+class GroupStats:
+    origin: Vector2 = (0.0, 0.0)
+    count: int = 0
+    sum_x: float = 0.0
+    sum_y: float = 0.0
+    sum_xx: float = 0.0
+    sum_yy: float = 0.0
+
+    @classmethod
+    def from_points(cls, points: PointStore, origin: Vector2) -> "GroupStats":
+        stats = cls(origin=origin)
+        stats.add(points.positions)
+        return stats
+
+    def add(self, positions: np.ndarray, sign: int = 1) -> None:
+        offsets = positions - self.origin
+        sum_x, sum_y = offsets.sum(axis=0).tolist()
+        sum_xx, sum_yy = (offsets * offsets).sum(axis=0).tolist()
+        self.count += sign * len(positions)
+        self.sum_x += sign * sum_x
+        self.sum_y += sign * sum_y
+        self.sum_xx += sign * sum_xx
+        self.sum_yy += sign * sum_yy
+
+    def replace(self, before: np.ndarray, after: np.ndarray) -> None:
+        self.add(before, -1)
+        self.add(after)
+
+    def translate(self, dx: float, dy: float) -> None:
+        self.origin = (self.origin[0] + dx, self.origin[1] + dy)
+
+    def mean(self) -> Vector2:
+        if not self.count:
+            return self.origin
+        return self.origin[0] + self.sum_x / self.count, self.origin[1] + self.sum_y / self.count
+
+    def spread(self, center: Vector2) -> Vector2:
+        if not self.count:
+            return (0.0, 0.0)
+        x, y = self.squared_deviation(center)
+        return x / self.count, y / self.count
+
+    def squared_deviation(self, center: Vector2) -> Vector2:
+        ex = center[0] - self.origin[0]
+        ey = center[1] - self.origin[1]
+        return (
+            self.sum_xx - 2.0 * ex * self.sum_x + self.count * ex * ex,
+            self.sum_yy - 2.0 * ey * self.sum_y + self.count * ey * ey,
+        )
+
+
 @dataclass
 class Group:
     id: str
     color: str
     mean: Vector2
     variance: Vector2
-    points: List[Point] = field(default_factory=list)
+    points: PointStore = field(default_factory=PointStore.empty)
     center_position: Vector2 = (0.0, 0.0)
+    _stats: GroupStats | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.points, PointStore):
+            self.points = PointStore.from_points(self.points)
+
+    @property
+    def stats(self) -> GroupStats:
+        if self._stats is None:
+            self._stats = GroupStats.from_points(self.points, self.center_position)
+        return self._stats
+
+    @stats.setter
+    def stats(self, stats: GroupStats) -> None:
+        self._stats = stats
+
+    def translate(self, dx: float, dy: float) -> None:
+        stats = self.stats
+        self.center_position = (self.center_position[0] + dx, self.center_position[1] + dy)
+        self.points.translate(dx, dy)
+        stats.translate(dx, dy)
 
 
 @dataclass
@@ -28,3 +105,4 @@ class AppState:
     active_tool: str = "select"
     pending_kmeans: List[Vector2] = field(default_factory=list)
     seed: int | None = None
+    group_versions: Dict[str, int] = field(default_factory=dict)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import csv
+import json
+from dataclasses import dataclass
+from itertools import islice
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from app.models import Group, GroupStats, PointStore
+
+IMPORT_SUFFIXES = (".csv", ".ndjson", ".jsonl")
+CHUNK_ROWS = 65536
+INITIAL_CAPACITY = 1024
+PALETTE = (
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+    "#bcbd22",
+    "#17becf",
+)
+
+ImportProgress = Callable[[int, int], None]
+Chunk = Tuple[np.ndarray, List[str], List[str | None]]
+
+
+@dataclass(frozen=True)
+class ImportFields:
+    x: str = "x"
+    y: str = "y"
+    label: str = "label"
+    color: str = "color"
+
+
+def import_points(
+    path: Path,
+    fields: ImportFields = ImportFields(),
+    chunk_rows: int = CHUNK_ROWS,
+    on_progress: ImportProgress | None = None,
+) -> List[Group]:
+    if path.suffix.lower() not in IMPORT_SUFFIXES:
+        raise ValueError(f"{path} is not one of {', '.join(IMPORT_SUFFIXES)}.")
+    total = path.stat().st_size
+    buffers: Dict[str, _GroupBuffer] = {}
+    with path.open("rb") as handle:
+        reader = _csv_chunks if path.suffix.lower() == ".csv" else _json_chunks
+        for positions, labels, colors in reader(handle, fields, chunk_rows):
+            _append_chunk(buffers, positions, labels, colors)
+            if on_progress:
+                on_progress(handle.tell(), total)
+    if not buffers:
+        raise ValueError(f"{path} contains no points.")
+    return [buffer.to_group(group_id) for group_id, buffer in buffers.items()]
+
+
+class _GroupBuffer:
+    __slots__ = ("color", "positions", "size", "stats")
+
+    def __init__(self, color: str) -> None:
+        self.color = color
+        self.positions = np.empty((INITIAL_CAPACITY, 2), dtype=np.float64)
+        self.size = 0
+        self.stats: GroupStats | None = None
+
+    def append(self, positions: np.ndarray) -> None:
+        end = self.size + len(positions)
+        if end > len(self.positions):
+            self.positions.resize((max(end, 2 * len(self.positions)), 2), refcheck=False)
+        self.positions[self.size : end] = positions
+        self.size = end
+        if self.stats is None:
+            x, y = positions[0].tolist()
+            self.stats = GroupStats(origin=(x, y))
+        self.stats.add(positions)
+
+    def to_group(self, group_id: str) -> Group:
+        self.positions.resize((self.size, 2), refcheck=False)
+        mean = self.stats.mean()
+        group = Group(
+            id=group_id,
+            color=self.color,
+            mean=mean,
+            variance=self.stats.spread(mean),
+            points=PointStore.from_positions(group_id, self.positions),
+            center_position=mean,
+        )
+        group.stats = self.stats
+        return group
+
+
+def _append_chunk(
+    buffers: Dict[str, _GroupBuffer], positions: np.ndarray, labels: Sequence[str], colors: Sequence[str | None]
+) -> None:
+    codes: Dict[str, int] = {}
+    inverse = np.fromiter((codes.setdefault(label, len(codes)) for label in labels), np.int64, len(labels))
+    order = np.argsort(inverse, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(inverse, minlength=len(codes)))))
+    for group_id, code in codes.items():
+        rows = order[bounds[code] : bounds[code + 1]]
+        buffer = buffers.get(group_id)
+        if buffer is None:
+            color = colors[rows[0]] or PALETTE[len(buffers) % len(PALETTE)]
+            buffer = buffers[group_id] = _GroupBuffer(color)
+        buffer.append(positions[rows])
+
+
+def _csv_chunks(handle: BinaryIO, fields: ImportFields, chunk_rows: int) -> Iterator[Chunk]:
+    header = next(csv.reader([handle.readline().decode("utf-8-sig")]), [])
+    header = [name.strip() for name in header]
+    x, y, label = (_column(header, name) for name in (fields.x, fields.y, fields.label))
+    color = header.index(fields.color) if fields.color in header else None
+    while lines := list(islice(handle, chunk_rows)):
+        rows = [row for row in csv.reader(b"".join(lines).decode("utf-8").splitlines()) if row]
+        positions = _positions([row[x] for row in rows], [row[y] for row in rows])
+        colors = [row[color] for row in rows] if color is not None else [None] * len(rows)
+        yield positions, [row[label] for row in rows], colors
+
+
+def _json_chunks(handle: BinaryIO, fields: ImportFields, chunk_rows: int) -> Iterator[Chunk]:
+    while lines := list(islice(handle, chunk_rows)):
+        records = [json.loads(line) for line in lines if line.strip()]
+        positions = _positions([record[fields.x] for record in records], [record[fields.y] for record in records])
+        labels = [str(record[fields.label]) for record in records]
+        yield positions, labels, [record.get(fields.color) for record in records]
+
+
+def _positions(xs: List, ys: List) -> np.ndarray:
+    positions = np.empty((len(xs), 2), dtype=np.float64)
+    positions[:, 0] = np.array(xs, dtype=np.float64)
+    positions[:, 1] = np.array(ys, dtype=np.float64)
+    return positions
+
+
+def _column(header: List[str], name: str) -> int:
+    if name not in header:
+        raise ValueError(f"CSV header has no {name!r} column.")
+    return header.index(name)
@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+Position = Tuple[float, float]
+
+
+class PointStore:
+    __slots__ = ("positions", "labels", "overlap", "indices", "names")
+
+    def __init__(
+        self,
+        positions: np.ndarray,
+        labels: np.ndarray,
+        overlap: np.ndarray,
+        indices: np.ndarray,
+        names: Tuple[str, ...],
+    ) -> None:
+        self.positions = positions
+        self.labels = labels
+        self.overlap = overlap
+        self.indices = indices
+        self.names = names
+
+    @classmethod
+    def empty(cls) -> PointStore:
+        store = cls.from_positions("", np.empty((0, 2), dtype=np.float64))
+        store.names = ()
+        return store
+
+    @classmethod
+    def from_positions(cls, group_id: str, positions: np.ndarray) -> PointStore:
+        count = len(positions)
+        return cls(
+            positions=np.ascontiguousarray(positions, dtype=np.float64).reshape(count, 2),
+            labels=np.zeros(count, dtype=np.int32),
+            overlap=np.zeros(count, dtype=bool),
+            indices=np.arange(count, dtype=np.int32),
+            names=(group_id,),
+        )
+
+    @classmethod
+    def from_points(cls, points: Iterable) -> PointStore:
+        points = list(points)
+        vocabulary: Dict[str, int] = {}
+        labels = [vocabulary.setdefault(point.original_group_id, len(vocabulary)) for point in points]
+        return cls(
+            positions=np.array([point.position for point in points], dtype=np.float64).reshape(-1, 2),
+            labels=np.array(labels, dtype=np.int32),
+            overlap=np.array([point.is_overlap for point in points], dtype=bool),
+            indices=np.array([_point_index(point, row) for row, point in enumerate(points)], dtype=np.int32),
+            names=tuple(vocabulary),
+        )
+
+    @classmethod
+    def concat(cls, stores: Sequence[PointStore]) -> PointStore:
+        if not stores:
+            return cls.empty()
+        vocabulary: Dict[str, int] = {}
+        for store in stores:
+            for name in store.names:
+                vocabulary.setdefault(name, len(vocabulary))
+        labels = [
+            np.array([vocabulary[name] for name in store.names], dtype=np.int32)[store.labels]
+            for store in stores
+        ]
+        return cls(
+            positions=np.concatenate([store.positions for store in stores]).reshape(-1, 2),
+            labels=np.concatenate(labels),
+            overlap=np.concatenate([store.overlap for store in stores]),
+            indices=np.concatenate([store.indices for store in stores]),
+            names=tuple(vocabulary),
+        )
+
+    def take(self, rows: np.ndarray) -> PointStore:
+        return PointStore(
+            self.positions[rows], self.labels[rows], self.overlap[rows], self.indices[rows], self.names
+        )
+
+    def copy(self) -> PointStore:
+        return self.take(np.arange(len(self)))
+
+    def translate(self, dx: float, dy: float) -> None:
+        self.positions += (dx, dy)
+
+    def ids(self) -> List[str]:
+        names = self.names
+        return [f"{names[label]}-{index}" for label, index in zip(self.labels.tolist(), self.indices.tolist())]
+
+    @property
+    def xs(self) -> np.ndarray:
+        return self.positions[:, 0]
+
+    @property
+    def ys(self) -> np.ndarray:
+        return self.positions[:, 1]
+
+    @property
+    def nbytes(self) -> int:
+        return self.positions.nbytes + self.labels.nbytes + self.overlap.nbytes + self.indices.nbytes
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __iter__(self) -> Iterator[PointView]:
+        return (PointView(self, row) for row in range(len(self)))
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            return [PointView(self, row) for row in range(*key.indices(len(self)))]
+        row = range(len(self))[key]
+        return PointView(self, row)
+
+
+class PointView:
+    __slots__ = ("_store", "_row")
+
+    def __init__(self, store: PointStore, row: int) -> None:
+        self._store = store
+        self._row = row
+
+    @property
+    def id(self) -> str:
+        return f"{self.original_group_id}-{self._store.indices[self._row]}"
+
+    @property
+    def original_group_id(self) -> str:
+        return self._store.names[self._store.labels[self._row]]
+
+    @property
+    def position(self) -> Position:
+        x, y = self._store.positions[self._row].tolist()
+        return x, y
+
+    @position.setter
+    def position(self, value: Position) -> None:
+        self._store.positions[self._row] = value
+
+    @property
+    def is_overlap(self) -> bool:
+        return bool(self._store.overlap[self._row])
+
+    @is_overlap.setter
+    def is_overlap(self, value: bool) -> None:
+        self._store.overlap[self._row] = value
+
+
+def _point_index(point, fallback: int) -> int:
+    prefix, _, suffix = point.id.rpartition("-")
+    if prefix == point.original_group_id and suffix.isdigit():
+        return int(suffix)
+    return fallback
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Callable
+
+from PyQt6.QtWidgets import QFileDialog, QWidget
+
+from app.dataset_io import DATASET_SUFFIX
+from app.logic.clustering import INIT_CENTERS, INIT_KMEANS_PLUS_PLUS, KMeansOptions
+from app.logic.convergence import STOPPING_PRESETS
+from app.logic.state_manager import StateManager
+from app.ui.board_widget import BoardWidget
+from app.ui.toolbar import ToolbarWidget
+
+
+class BoardActions:
+    def __init__(
+        self,
+        parent: QWidget,
+        manager: StateManager,
+        board: BoardWidget,
+        toolbar: ToolbarWidget,
+        cancel_kmeans: Callable[[], None],
+        notify: Callable[[str], None],
+        dataset_dir: Path,
+    ) -> None:
+        self.parent = parent
+        self.manager = manager
+        self.board = board
+        self.toolbar = toolbar
+        self._cancel_kmeans = cancel_kmeans
+        self._notify = notify
+        self.dataset_dir = dataset_dir
+
+    def apply_kmeans(self) -> None:
+        self._cancel_kmeans()
+        self.manager.apply_kmeans()
+        self.board.set_score_text(None)
+        self.toolbar.set_apply_enabled(False)
+        self.toolbar.show_status("K-mean applied.")
+        self._notify("K-mean applied.")
+
+    def explode_group(self, group_id: str) -> None:
+        self._cancel_kmeans()
+        self.manager.regenerate_group(group_id)
+        self._notify(f"Group {group_id} regenerated.")
+
+    def set_seed(self, seed: int) -> None:
+        self.manager.set_seed(seed if seed >= 0 else None)
+        self._notify(f"Seed set to {seed}.")
+
+    def set_kmeans_options(self, engine: str, plus_plus: bool, restarts: int, stopping: str) -> None:
+        init = INIT_KMEANS_PLUS_PLUS if plus_plus else INIT_CENTERS
+        options = KMeansOptions(init=init, n_init=restarts, engine=engine, stopping=STOPPING_PRESETS[stopping])
+        self.manager.set_kmeans_options(options)
+        self._notify(f"K-mean engine {engine}, init {init}, {restarts} restart(s), stop on {stopping}.")
+
+    def undo(self) -> None:
+        self._step_history(self.manager.undo, "Undid", "Nothing to undo.")
+
+    def redo(self) -> None:
+        self._step_history(self.manager.redo, "Redid", "Nothing to redo.")
+
+    def save_dataset(self) -> None:
+        default = self.dataset_dir / f"board{DATASET_SUFFIX}"
+        path, _ = QFileDialog.getSaveFileName(
+            self.parent, "Save dataset", str(default), f"Points dataset (*{DATASET_SUFFIX})"
+        )
+        if not path:
+            return
+        target = Path(path).with_suffix(DATASET_SUFFIX)
+        self.manager.save_dataset(target)
+        self.toolbar.show_status(f"Saved {target.name}.")
+        self._notify(f"Dataset saved to {target}.")
+
+    def _step_history(self, step: Callable[[], str | None], verb: str, empty: str) -> None:
+        self._cancel_kmeans()
+        label = step()
+        if label is None:
+            self.toolbar.show_status(empty)
+            return
+        self.board.set_score_text(None)
+        self.toolbar.set_apply_enabled(False)
+        steps, size = len(self.manager.history_steps()), self.manager.history_nbytes()
+        self.toolbar.show_status(f"{verb} {label} · {steps} undo step(s), {size / 1e6:.1f} MB")
+        self._notify(f"{verb} {label}.")
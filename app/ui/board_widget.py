@@ -1,12 +1,18 @@
 from __future__ import annotations
-from typing import Callable
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QMouseEvent, QPainter
+from typing import Callable, Dict, Sequence
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QMouseEvent, QPainter, QRegion
 from PyQt6.QtWidgets import QWidget
+from app.logic.profiling import span
 from app.models import AppState, Group, Vector2
 from app.ui import coordinates
 from app.ui.bomb_overlay import BombOverlay
-from app.ui.draw_helpers import draw_groups, draw_pending, radius_for_group
+from app.ui.dirty_region import Envelope, changed_region, group_envelopes, pending_region
+from app.ui.drag_coalescer import DragCoalescer
+from app.ui.draw_helpers import draw_groups, draw_pending, group_rect
+from app.ui.geometry_cache import GeometryCache
+from app.ui.perf_overlay import PerfOverlay
+from app.ui.point_renderer import DEFAULT_LOD_THRESHOLD
 from app.ui.score_overlay import ScoreOverlay
 
 
@@ -17,27 +23,40 @@ class BoardWidget(QWidget):
         move_group: Callable[[str, Vector2], None],
         explode_group: Callable[[str], None],
         circle_radius: float,
+        lod_threshold: int = DEFAULT_LOD_THRESHOLD,
+        end_drag: Callable[[], None] | None = None,
     ) -> None:
         super().__init__()
         self._state_provider = state_provider; self._move_group = move_group; self._explode_group = explode_group
-        self._circle_radius = circle_radius
+        self._end_drag = end_drag
+        self._circle_radius = circle_radius; self.lod_threshold = lod_threshold
         self._dragging_id: str | None = None; self._last_world: Vector2 | None = None
-        self._bomb = BombOverlay(); self._score = ScoreOverlay()
+        self._bomb = BombOverlay(); self._score = ScoreOverlay(); self._geometry = GeometryCache()
+        self._perf = PerfOverlay(); self._drag = DragCoalescer(self, self._apply_drag)
 
     def paintEvent(self, event) -> None:  # type: ignore[override]
+        with span("paint"):
+            self._paint(event.region())
+
+    def _paint(self, dirty: QRegion) -> None:
         painter = QPainter(self); painter.setRenderHint(QPainter.RenderHint.Antialiasing)
         origin = coordinates.origin(self.width(), self.height())
         to_screen = lambda pos: coordinates.to_screen(pos, origin)
-        groups = self._state_provider().groups; radii = {group.id: radius_for_group(group) for group in groups}
-        draw_groups(painter, groups, lambda group: radii[group.id], to_screen)
-        draw_pending(painter, self._state_provider().pending_kmeans, groups, radii, to_screen)
-        self._bomb.paint(painter); self._score.paint(painter)
+        state = self._state_provider(); groups = state.groups; versions = state.group_versions
+        self._geometry.retain(versions)
+        radii = {group.id: self._geometry.radius(group, versions.get(group.id)) for group in groups}
+        screen_origin = (origin.x(), origin.y())
+        screen = lambda group: self._geometry.screen_positions(group, versions.get(group.id), screen_origin)
+        visible = [group for group in groups if dirty.intersects(self._group_rect(group, radii[group.id], origin))]
+        draw_groups(painter, visible, lambda group: radii[group.id], to_screen, screen, self.lod_threshold)
+        draw_pending(painter, state.pending_kmeans, groups, radii, to_screen)
+        self._bomb.paint(painter); self._score.paint(painter); self._perf.paint(painter, self.rect())
 
     def mousePressEvent(self, event: QMouseEvent) -> None:
         if event.buttons() & Qt.MouseButton.LeftButton:
             if self._bomb.hit_test(event.position()):
                 self._bomb.begin_drag(event.position())
-                self.update()
+                self.update(self._bomb.rect())
                 event.accept()
                 return
             world = self._to_world(event.position())
@@ -51,8 +70,9 @@ class BoardWidget(QWidget):
 
     def mouseMoveEvent(self, event: QMouseEvent) -> None:
         if self._bomb.is_dragging():
+            previous = self._bomb.rect()
             self._bomb.update_drag(event.position())
-            self.update()
+            self.update(previous.united(self._bomb.rect()))
             event.accept()
             return
         if self._dragging_id and event.buttons() & Qt.MouseButton.LeftButton:
@@ -60,8 +80,7 @@ class BoardWidget(QWidget):
             if self._last_world:
                 delta = (world[0] - self._last_world[0], world[1] - self._last_world[1])
                 if delta != (0.0, 0.0):
-                    self._move_group(self._dragging_id, delta)
-                    self.update()
+                    self._drag.add(delta)
             self._last_world = world
             event.accept()
             return
@@ -75,9 +94,40 @@ class BoardWidget(QWidget):
                 self.update()
                 event.accept()
                 return
+            if self._dragging_id:
+                self._drag.flush()
+                if self._end_drag:
+                    self._end_drag()
             self._dragging_id = None; self._last_world = None
         super().mouseReleaseEvent(event)
 
+    def _apply_drag(self, delta: Vector2) -> None:
+        if self._dragging_id is None:
+            return
+        before = self._envelopes()
+        self._move_group(self._dragging_id, delta)
+        self._repaint_changed(before, self._envelopes())
+
+    def _repaint_changed(self, before: Dict[str, Envelope], after: Dict[str, Envelope]) -> None:
+        dirty = changed_region(before, after, bool(self._state_provider().pending_kmeans))
+        if dirty is None:
+            self.update()
+            return
+        if self._perf.visible:
+            dirty = dirty.united(self._perf.rect(self.rect(), self.fontMetrics()))
+        self.update(dirty)
+
+    def update_pending(self, previous: Sequence[Vector2]) -> None:
+        origin = coordinates.origin(self.width(), self.height())
+        self.update(pending_region(self._state_provider(), previous, self._geometry, origin))
+
+    def _envelopes(self) -> Dict[str, Envelope]:
+        origin = coordinates.origin(self.width(), self.height())
+        return group_envelopes(self._state_provider(), self._geometry, origin, self.fontMetrics())
+
+    def _group_rect(self, group: Group, radius: float, origin) -> QRect:
+        return group_rect(group, radius, coordinates.to_screen(group.center_position, origin), self.fontMetrics())
+
     def _handle_bomb_drop(self, position) -> None:
         for group in self._state_provider().groups:
             if (self._to_screen(group.center_position) - position).manhattanLength() <= 24:
@@ -96,5 +146,11 @@ class BoardWidget(QWidget):
     def _to_screen(self, position: Vector2):
         return coordinates.to_screen(position, coordinates.origin(self.width(), self.height()))
 
+    def geometry_cache_stats(self) -> dict:
+        return self._geometry.stats()
+
     def set_score_text(self, text: str | None) -> None:
         self._score.set_text(text); self.update()
+
+    def set_perf_visible(self, visible: bool) -> None:
+        self._perf.visible = visible; self.update()
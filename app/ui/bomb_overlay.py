@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtCore import QPointF, QRect, Qt
 from PyQt6.QtGui import QPainter
 
 
@@ -21,6 +21,10 @@ class BombOverlay:
     def hit_test(self, point: QPointF, radius: float = 24.0) -> bool:
         return (point - self.current()).manhattanLength() <= radius
 
+    def rect(self) -> QRect:
+        center = self.current().toPoint()
+        return QRect(center.x() - 16, center.y() - 16, 32, 32)
+
     def begin_drag(self, point: QPointF) -> None:
         self._dragging = True
         self._position = point
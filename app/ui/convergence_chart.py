@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+from PyQt6.QtCore import QPointF, QRectF, Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+from PyQt6.QtWidgets import QWidget
+
+from app.logic.convergence import IterationStats
+
+SERIES = (("sse", "#1f77b4"), ("shift", "#ff7f0e"), ("reassigned", "#2ca02c"))
+
+
+class ConvergenceChart(QWidget):
+    def __init__(self) -> None:
+        super().__init__()
+        self._trace: Sequence[IterationStats] = ()
+        self.setMinimumSize(180, 140)
+
+    def set_trace(self, trace: Sequence[IterationStats]) -> None:
+        self._trace = trace
+        self.update()
+
+    def paintEvent(self, event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        plot = QRectF(self.rect()).adjusted(4, 4, -4, -36)
+        painter.setPen(QColor("#bbbbbb"))
+        painter.drawRect(plot)
+        if not self._trace:
+            painter.drawText(plot, Qt.AlignmentFlag.AlignCenter, "No convergence trace")
+            return
+        for name, color in SERIES:
+            values = [getattr(stats, name) for stats in self._trace]
+            polygon = _normalized(values, plot)
+            if polygon is not None:
+                painter.setPen(QPen(QColor(color), 1.5))
+                painter.drawPolyline(polygon)
+        last = self._trace[-1]
+        sse = f"{last.sse:.4g}" if math.isfinite(last.sse) else "–"
+        painter.setPen(Qt.GlobalColor.black)
+        caption = QRectF(self.rect()).adjusted(4, self.height() - 34, -4, 0)
+        painter.drawText(
+            caption,
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop,
+            f"{len(self._trace)} iterations, {last.seconds * 1000.0:.1f} ms\n"
+            f"SSE {sse}  shift {last.shift:.3g}  moved {max(last.reassigned, 0)}",
+        )
+
+
+def _normalized(values: Sequence[float], plot: QRectF) -> QPolygonF | None:
+    finite = [value for value in values if math.isfinite(value) and value >= 0]
+    if len(finite) != len(values) or not values:
+        return None
+    top = max(finite) or 1.0
+    step = plot.width() / max(len(values) - 1, 1)
+    return QPolygonF(
+        [
+            QPointF(plot.left() + index * step, plot.bottom() - plot.height() * value / top)
+            for index, value in enumerate(values)
+        ]
+    )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Dict, Sequence, Tuple
+
+from PyQt6.QtCore import QPointF, QRect
+from PyQt6.QtGui import QFontMetrics, QRegion
+
+from app.models import AppState, Vector2
+from app.ui import coordinates
+from app.ui.draw_helpers import group_rect, pending_rect
+from app.ui.geometry_cache import GeometryCache
+
+Envelope = Tuple[int | None, float, QRect]
+
+
+def group_envelopes(
+    state: AppState, geometry: GeometryCache, origin: QPointF, metrics: QFontMetrics
+) -> Dict[str, Envelope]:
+    envelopes = {}
+    for group in state.groups:
+        version = state.group_versions.get(group.id)
+        radius = geometry.radius(group, version)
+        center = coordinates.to_screen(group.center_position, origin)
+        envelopes[group.id] = (version, radius, group_rect(group, radius, center, metrics))
+    return envelopes
+
+
+def changed_region(before: Dict[str, Envelope], after: Dict[str, Envelope], pending: bool) -> QRegion | None:
+    dirty = QRegion()
+    for group_id, (version, radius, rect) in after.items():
+        previous = before.get(group_id)
+        if previous is None or (pending and previous[1] != radius):
+            return None
+        if previous[0] != version or previous[0] is None:
+            dirty = dirty.united(previous[2]).united(rect)
+    return dirty
+
+
+def pending_region(
+    state: AppState, previous: Sequence[Vector2], geometry: GeometryCache, origin: QPointF
+) -> QRegion:
+    dirty = QRegion()
+    for centers in (previous, state.pending_kmeans):
+        for group, center in zip(state.groups, centers):
+            radius = geometry.radius(group, state.group_versions.get(group.id))
+            dirty = dirty.united(pending_rect(radius, coordinates.to_screen(center, origin)))
+    return dirty
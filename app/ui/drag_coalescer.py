@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, Qt, QTimer
+from PyQt6.QtWidgets import QWidget
+
+from app.models import Vector2
+
+DEFAULT_REFRESH_HZ = 60.0
+
+
+class DragCoalescer(QObject):
+    def __init__(self, widget: QWidget, apply: Callable[[Vector2], None]) -> None:
+        super().__init__(widget)
+        self._widget = widget
+        self._apply = apply
+        self._delta: Vector2 = (0.0, 0.0)
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._next_frame)
+
+    def add(self, delta: Vector2) -> None:
+        self._delta = (self._delta[0] + delta[0], self._delta[1] + delta[1])
+        if not self._timer.isActive():
+            self._next_frame()
+
+    def flush(self) -> None:
+        self._timer.stop()
+        self._emit()
+
+    def _next_frame(self) -> None:
+        if self._emit():
+            self._timer.start(self._frame_interval())
+
+    def _emit(self) -> bool:
+        delta, self._delta = self._delta, (0.0, 0.0)
+        if delta == (0.0, 0.0):
+            return False
+        self._apply(delta)
+        return True
+
+    def _frame_interval(self) -> int:
+        screen = self._widget.screen()
+        rate = screen.refreshRate() if screen is not None else 0.0
+        return max(1, round(1000.0 / (rate or DEFAULT_REFRESH_HZ)))
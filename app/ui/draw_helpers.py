@@ -1,27 +1,31 @@
 from __future__ import annotations
 
-import math
 from typing import Callable, Iterable, Mapping, Sequence
 
-from PyQt6.QtCore import QPointF, Qt
-from PyQt6.QtGui import QColor, QPainter, QPen
+import numpy as np
+from PyQt6.QtCore import QPointF, QRect, QRectF, Qt
+from PyQt6.QtGui import QColor, QFontMetrics, QPainter, QPen
 
-from app.models import Group, Point, Vector2
+from app.models import Group, Vector2
+from app.ui.point_renderer import DEFAULT_LOD_THRESHOLD, draw_point_batch
 
+LABEL_OFFSET = QPointF(14, 4)
+ENVELOPE_MARGIN = 3.0
+PENDING_MARKER = 9.0
 
-def radius_for_group(
-    group: Group, padding: float = 20.0, minimum: float = 40.0
-) -> float:
-    if not group.points:
-        return max(minimum, padding)
-    max_distance = max(
-        math.hypot(
-            point.position[0] - group.center_position[0],
-            point.position[1] - group.center_position[1],
-        )
-        for point in group.points
-    )
-    return max(max_distance + padding, minimum)
+
+def group_rect(group: Group, radius: float, center: QPointF, metrics: QFontMetrics) -> QRect:
+    label = QRectF(metrics.boundingRect(group.id.capitalize())).translated(center + LABEL_OFFSET)
+    return _circle_rect(center, radius).united(label).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+
+def pending_rect(radius: float, center: QPointF) -> QRect:
+    return _circle_rect(center, max(radius, PENDING_MARKER)).toAlignedRect().adjusted(-1, -1, 1, 1)
+
+
+def _circle_rect(center: QPointF, radius: float) -> QRectF:
+    reach = radius + ENVELOPE_MARGIN
+    return QRectF(center.x() - reach, center.y() - reach, 2 * reach, 2 * reach)
 
 
 def draw_groups(
@@ -29,10 +33,13 @@ def draw_groups(
     groups: Sequence[Group],
     radius_provider: Callable[[Group], float],
     to_screen: Callable[[Vector2], QPointF],
+    screen_provider: Callable[[Group], np.ndarray] | None = None,
+    lod_threshold: int = DEFAULT_LOD_THRESHOLD,
 ) -> None:
     for group in groups:
         radius = radius_provider(group)
-        _draw_group(painter, group, radius, to_screen)
+        screen = screen_provider(group) if screen_provider else _screen_positions(group, to_screen)
+        _draw_group(painter, group, radius, screen, to_screen, lod_threshold)
 
 
 def draw_pending(
@@ -53,14 +60,16 @@ def draw_pending(
         painter.drawEllipse(screen, radius, radius)
         painter.setBrush(QColor(group.color))
         painter.setPen(Qt.GlobalColor.black)
-        painter.drawEllipse(screen, 9, 9)
+        painter.drawEllipse(screen, PENDING_MARKER, PENDING_MARKER)
 
 
 def _draw_group(
     painter: QPainter,
     group: Group,
     circle_radius: float,
+    screen: np.ndarray,
     to_screen: Callable[[Vector2], QPointF],
+    lod_threshold: int,
 ) -> None:
     center = to_screen(group.center_position)
     color = QColor(group.color)
@@ -72,19 +81,13 @@ def _draw_group(
     painter.setBrush(color)
     painter.drawEllipse(center, 12, 12)
     painter.setPen(Qt.GlobalColor.black)
-    painter.drawText(center + QPointF(14, 4), group.id.capitalize())
-    for point in group.points:
-        _draw_point(painter, point, color, to_screen)
+    painter.drawText(center + LABEL_OFFSET, group.id.capitalize())
+    draw_point_batch(painter, screen, group.points.overlap, color, lod_threshold)
 
 
-def _draw_point(
-    painter: QPainter,
-    point: Point,
-    color: QColor,
-    to_screen: Callable[[Vector2], QPointF],
-) -> None:
-    center = to_screen(point.position)
-    radius = 6 if point.is_overlap else 5
-    painter.setBrush(color)
-    painter.setPen(Qt.GlobalColor.black if point.is_overlap else color)
-    painter.drawEllipse(center, radius, radius)
+def _screen_positions(group: Group, to_screen: Callable[[Vector2], QPointF]) -> np.ndarray:
+    origin = to_screen((0.0, 0.0))
+    screen = np.empty_like(group.points.positions)
+    screen[:, 0] = origin.x() + group.points.positions[:, 0]
+    screen[:, 1] = origin.y() - group.points.positions[:, 1]
+    return screen
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Tuple
+
+import numpy as np
+
+from app.models import Group
+
+
+def radius_for_group(
+    group: Group, padding: float = 20.0, minimum: float = 40.0
+) -> float:
+    if not group.points:
+        return max(minimum, padding)
+    offsets = group.points.positions - group.center_position
+    max_distance = float(np.hypot(offsets[:, 0], offsets[:, 1]).max())
+    return max(max_distance + padding, minimum)
+
+
+@dataclass
+class GroupGeometry:
+    version: int | None
+    radius: float
+    origin: Tuple[float, float] | None = None
+    screen: np.ndarray | None = None
+
+
+class GeometryCache:
+    def __init__(self) -> None:
+        self._entries: Dict[str, GroupGeometry] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def geometry(self, group: Group, version: int | None) -> GroupGeometry:
+        entry = self._entries.get(group.id)
+        if entry is not None and version is not None and entry.version == version:
+            self.hits += 1
+            return entry
+        self.misses += 1
+        entry = GroupGeometry(version, radius_for_group(group))
+        self._entries[group.id] = entry
+        return entry
+
+    def radius(self, group: Group, version: int | None) -> float:
+        return self.geometry(group, version).radius
+
+    def screen_positions(
+        self, group: Group, version: int | None, origin: Tuple[float, float]
+    ) -> np.ndarray:
+        entry = self.geometry(group, version)
+        if entry.screen is None or entry.origin != origin:
+            screen = np.empty_like(group.points.positions)
+            screen[:, 0] = origin[0] + group.points.positions[:, 0]
+            screen[:, 1] = origin[1] - group.points.positions[:, 1]
+            entry.origin, entry.screen = origin, screen
+        return entry.screen
+
+    def retain(self, group_ids: Iterable[str]) -> None:
+        keep = set(group_ids)
+        for group_id in list(self._entries):
+            if group_id not in keep:
+                del self._entries[group_id]
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
+
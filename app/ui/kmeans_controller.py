@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QThreadPool
+
+from app.logic.kmeans_job import KMeansResult, KMeansSnapshot
+from app.logic.profiling import span
+from app.logic.screenshot_service import ScreenshotWriter
+from app.logic.state_manager import StateManager
+from app.ui.board_widget import BoardWidget
+from app.ui.convergence_chart import ConvergenceChart
+from app.ui.kmeans_worker import KMeansWorker
+from app.ui.toolbar import ToolbarWidget
+
+
+class KMeansController(QObject):
+    def __init__(
+        self,
+        manager: StateManager,
+        board: BoardWidget,
+        toolbar: ToolbarWidget,
+        chart: ConvergenceChart,
+        screenshots: ScreenshotWriter,
+        notify: Callable[[str], None],
+    ) -> None:
+        super().__init__(board)
+        self.manager = manager
+        self.board = board
+        self.toolbar = toolbar
+        self.chart = chart
+        self.screenshots = screenshots
+        self._notify = notify
+        self._worker: KMeansWorker | None = None
+        self._running_workers: set[KMeansWorker] = set()
+
+    def compute(self) -> None:
+        self.start(self.manager.snapshot_kmeans())
+
+    def start(self, snapshot: KMeansSnapshot) -> None:
+        self.cancel()
+        cached = self.manager.cached_kmeans(snapshot)
+        if cached is not None:
+            self.manager.accept_kmeans(cached)
+            self._present(cached, "cached")
+            return
+        worker = KMeansWorker(snapshot)
+        worker.signals.progress.connect(self._show_progress)
+        worker.signals.finished.connect(self._finish)
+        worker.signals.failed.connect(self._fail)
+        for signal in (worker.signals.finished, worker.signals.cancelled, worker.signals.failed):
+            signal.connect(lambda *_, done=worker: self._running_workers.discard(done))
+        self._running_workers.add(worker)
+        self._worker = worker
+        self.toolbar.set_apply_enabled(False)
+        self.toolbar.show_status("Calculating K-mean…")
+        QThreadPool.globalInstance().start(worker)
+
+    def cancel(self) -> None:
+        if self._worker is not None:
+            self._worker.cancel()
+            self._worker = None
+            self.toolbar.show_status("K-mean cancelled.")
+
+    def _is_current_worker(self) -> bool:
+        return self._worker is not None and self.sender() is self._worker.signals
+
+    def _show_progress(self, iteration: int, shift: float) -> None:
+        if self._is_current_worker():
+            self.toolbar.show_status(f"K-mean iteration {iteration + 1} (shift {shift:.2f})")
+
+    def _fail(self, message: str) -> None:
+        if self._is_current_worker():
+            self._worker = None
+            self.toolbar.show_status(f"K-mean failed: {message}")
+
+    def _finish(self, result: KMeansResult) -> None:
+        if not self._is_current_worker():
+            return
+        self._worker = None
+        if not self.manager.accept_kmeans(result):
+            self.toolbar.show_status("K-mean result discarded (state changed).")
+            return
+        self._present(result, "computed")
+
+    def _present(self, result: KMeansResult, source: str) -> None:
+        percent, score, v_measure = result.percent, result.score, result.v_measure
+        ari, nmi = result.ari, result.nmi
+        self.board.set_score_text(f"V-measure {v_measure:.1f}% | ARI {ari:.1f}% | NMI {nmi:.1f}%")
+        self.chart.set_trace(result.trace)
+        with span("screenshot.grab"):
+            self.screenshots.submit(self.board.grab().toImage())
+        self.toolbar.show_status(
+            f"Score diff: {percent:+.2f}% (total {score:.2f}) | "
+            f"V-measure {v_measure:.1f}% | ARI {ari:.1f}% | NMI {nmi:.1f}%"
+        )
+        self.toolbar.set_apply_enabled(True)
+        self._notify(f"K-mean {source}. Δ{percent:+.2f}%, score {score:.2f}, V-measure {v_measure:.1f}%.")
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from app.logic.kmeans_job import KMeansCancelled, KMeansSnapshot, PreviewSnapshot, run_job, run_preview
+
+
+class KMeansSignals(QObject):
+    progress = pyqtSignal(int, float)
+    finished = pyqtSignal(object)
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class KMeansWorker(QRunnable):
+    def __init__(self, snapshot: KMeansSnapshot) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.snapshot = snapshot
+        self.signals = KMeansSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self) -> None:
+        self._cancel.set()
+
+    def is_cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def run(self) -> None:
+        try:
+            result = run_job(self.snapshot, self.signals.progress.emit, self._cancel.is_set)
+        except KMeansCancelled:
+            self.signals.cancelled.emit()
+        except Exception as error:  # noqa: BLE001 - surfaced to the GUI thread
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(result)
+
+
+class PreviewWorker(QRunnable):
+    def __init__(self, snapshot: PreviewSnapshot) -> None:
+        super().__init__()
+        self.setAutoDelete(False)
+        self.snapshot = snapshot
+        self.signals = KMeansSignals()
+
+    def run(self) -> None:
+        try:
+            result = run_preview(self.snapshot)
+        except Exception as error:  # noqa: BLE001 - surfaced to the GUI thread
+            self.signals.failed.emit(str(error))
+        else:
+            self.signals.finished.emit(result)
@@ -3,12 +3,19 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Callable
 
-from PyQt6.QtWidgets import QHBoxLayout, QMainWindow, QWidget
+from PyQt6.QtCore import QThreadPool
+from PyQt6.QtGui import QKeySequence, QShortcut
+from PyQt6.QtWidgets import QHBoxLayout, QMainWindow, QVBoxLayout, QWidget
 
-from app.logic.screenshot_service import save_widget_screenshot
+from app.logic.profiling import PROFILER
+from app.logic.screenshot_service import DROP_OLDEST, ScreenshotWriter
 from app.logic.state_manager import StateManager
-from app.models import AppState, Vector2
+from app.models import Vector2
+from app.ui.board_actions import BoardActions
 from app.ui.board_widget import BoardWidget
+from app.ui.convergence_chart import ConvergenceChart
+from app.ui.kmeans_controller import KMeansController
+from app.ui.preview_controller import PreviewController
 from app.ui.toolbar import ToolbarWidget
 
 
@@ -19,24 +26,45 @@ class MainWindow(QMainWindow):
         circle_radius: float,
         screenshot_dir: Path,
         status_callback: Callable[[str], None] | None = None,
+        screenshot_compression: int | None = None,
+        screenshot_policy: str = DROP_OLDEST,
     ) -> None:
         super().__init__()
         self.manager = manager
         self.circle_radius = circle_radius
         self.screenshot_dir = screenshot_dir
         self.status_callback = status_callback
+        self._notify: Callable[[str], None] = status_callback or (lambda message: None)
+        self.screenshots = ScreenshotWriter(
+            screenshot_dir, compression_level=screenshot_compression, policy=screenshot_policy
+        )
         self.board = BoardWidget(
             state_provider=lambda: self.manager.state,
             move_group=self._move_group,
-            explode_group=self._explode_group,
+            explode_group=lambda group_id: self.actions.explode_group(group_id),
             circle_radius=circle_radius,
+            end_drag=self._end_drag,
         )
         self.toolbar = ToolbarWidget(
-            on_compute=self._compute_kmeans,
-            on_apply=self._apply_kmeans,
-            on_seed_change=self._set_seed,
+            on_compute=lambda: self.kmeans.compute(),
+            on_apply=lambda: self.actions.apply_kmeans(),
+            on_seed_change=lambda seed: self.actions.set_seed(seed),
+            on_kmeans_options_change=lambda *choice: self.actions.set_kmeans_options(*choice),
+            on_save_dataset=lambda: self.actions.save_dataset(),
+            on_perf_toggle=self._set_profiling,
+            on_live_preview_toggle=lambda enabled: self.preview.set_live(enabled),
+        )
+        self.convergence_chart = ConvergenceChart()
+        self.kmeans = KMeansController(
+            manager, self.board, self.toolbar, self.convergence_chart, self.screenshots, self._notify
+        )
+        self.preview = PreviewController(manager, self.board, self.toolbar, self.kmeans.start, self._notify)
+        self.actions = BoardActions(
+            self, manager, self.board, self.toolbar, self.kmeans.cancel, self._notify, screenshot_dir
         )
         self._configure_layout()
+        QShortcut(QKeySequence(QKeySequence.StandardKey.Undo), self, self.actions.undo)
+        QShortcut(QKeySequence(QKeySequence.StandardKey.Redo), self, self.actions.redo)
         self.setWindowTitle("Points Cluster Playground")
         self.resize(960, 640)
 
@@ -45,38 +73,28 @@ class MainWindow(QMainWindow):
         layout = QHBoxLayout(container)
         layout.setContentsMargins(10, 10, 10, 10)
         layout.addWidget(self.board, 1)
-        layout.addWidget(self.toolbar)
+        side = QVBoxLayout()
+        side.addWidget(self.toolbar, 1)
+        side.addWidget(self.convergence_chart)
+        layout.addLayout(side)
         self.setCentralWidget(container)
 
     def _move_group(self, group_id: str, delta: Vector2) -> None:
+        self.kmeans.cancel()
         self.manager.move_group(group_id, delta)
+        if self.preview.live:
+            self.preview.request()
 
-    def _explode_group(self, group_id: str) -> None:
-        self.manager.regenerate_group(group_id)
-        self._notify(f"Group {group_id} regenerated.")
-
-    def _compute_kmeans(self) -> None:
-        _, _, score, percent, v_measure, ari, nmi = self.manager.compute_kmeans()
-        self.board.set_score_text(f"V-measure {v_measure:.1f}% | ARI {ari:.1f}% | NMI {nmi:.1f}%")
-        save_widget_screenshot(self.board, self.screenshot_dir)
-        self.toolbar.show_status(
-            f"Score diff: {percent:+.2f}% (total {score:.2f}) | "
-            f"V-measure {v_measure:.1f}% | ARI {ari:.1f}% | NMI {nmi:.1f}%"
-        )
-        self.toolbar.set_apply_enabled(True)
-        self._notify(f"K-mean computed. Δ{percent:+.2f}%, score {score:.2f}, V-measure {v_measure:.1f}%.")
-
-    def _apply_kmeans(self) -> None:
-        self.manager.apply_kmeans()
-        self.board.set_score_text(None)
-        self.toolbar.set_apply_enabled(False)
-        self.toolbar.show_status("K-mean applied.")
-        self._notify("K-mean applied.")
+    def _end_drag(self) -> None:
+        self.manager.end_interaction()
+        self.preview.finish_drag()
 
-    def _set_seed(self, seed: int) -> None:
-        self.manager.set_seed(seed if seed >= 0 else None)
-        self._notify(f"Seed set to {seed}.")
+    def closeEvent(self, event) -> None:  # type: ignore[override]
+        self.kmeans.cancel()
+        QThreadPool.globalInstance().waitForDone()
+        self.screenshots.close()
+        super().closeEvent(event)
 
-    def _notify(self, message: str) -> None:
-        if self.status_callback:
-            self.status_callback(message)
+    def _set_profiling(self, enabled: bool) -> None:
+        PROFILER.enabled = enabled
+        self.board.set_perf_visible(enabled)
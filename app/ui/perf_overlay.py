@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from typing import List
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QColor, QFontMetrics, QPainter
+
+from app.logic.profiling import PROFILER, Profiler
+
+CALC_SPANS = ("kmeans.snapshot", "kmeans.run", "kmeans.metrics", "screenshot.grab")
+
+TEXT_FLAGS = Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignTop
+
+
+class PerfOverlay:
+    def __init__(self, profiler: Profiler = PROFILER) -> None:
+        self._profiler = profiler
+        self.visible = False
+
+    def lines(self) -> List[str]:
+        summary = self._profiler.summary()
+        lines = [f"{self._profiler.rate('paint'):.0f} FPS"]
+        paint = summary.get("paint")
+        if paint:
+            lines.append(f"paint {paint['last_ms']:.1f} ms (p50 {paint['p50_ms']:.1f}, p99 {paint['p99_ms']:.1f})")
+        calc = [(name, summary[name]["last_ms"]) for name in CALC_SPANS if name in summary]
+        if calc:
+            lines.append(f"last calc {sum(ms for _, ms in calc):.1f} ms")
+            lines.extend(f"  {name.split('.', 1)[1]} {ms:.1f} ms" for name, ms in calc)
+        return lines
+
+    def rect(self, bounds: QRect, metrics: QFontMetrics) -> QRect:
+        text = metrics.boundingRect(bounds.adjusted(16, 12, -16, -12), TEXT_FLAGS, "\n".join(self.lines()))
+        return QRect(bounds.left(), bounds.top(), bounds.width(), text.bottom() + metrics.height())
+
+    def paint(self, painter: QPainter, bounds: QRect) -> None:
+        if not self.visible:
+            return
+        painter.save()
+        painter.setPen(QColor("#333333"))
+        painter.drawText(bounds.adjusted(16, 12, -16, -12), TEXT_FLAGS, "\n".join(self.lines()))
+        painter.restore()
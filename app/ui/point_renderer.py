@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+import numpy as np
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPainter, QPen, QPolygonF
+
+DEFAULT_LOD_THRESHOLD = 5000
+POINT_DIAMETER = 11.0
+OVERLAP_DIAMETER = 13.0
+LOD_DIAMETER = 2.0
+
+
+def to_polygon(screen: np.ndarray) -> QPolygonF:
+    polygon = QPolygonF()
+    polygon.resize(len(screen))
+    if len(screen):
+        buffer = polygon.data()
+        buffer.setsize(screen.nbytes)
+        np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)[:] = screen
+    return polygon
+
+
+def draw_point_batch(
+    painter: QPainter,
+    screen: np.ndarray,
+    overlap: np.ndarray,
+    color: QColor,
+    lod_threshold: int = DEFAULT_LOD_THRESHOLD,
+) -> None:
+    painter.save()
+    if len(screen) > lod_threshold:
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, False)
+        painter.setPen(_dot_pen(color, LOD_DIAMETER, Qt.PenCapStyle.SquareCap))
+        painter.drawPoints(to_polygon(screen))
+    else:
+        painter.setPen(_dot_pen(color, POINT_DIAMETER))
+        painter.drawPoints(to_polygon(screen[~overlap]))
+    if overlap.any():
+        highlighted = to_polygon(screen[overlap])
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(_dot_pen(QColor(Qt.GlobalColor.black), OVERLAP_DIAMETER))
+        painter.drawPoints(highlighted)
+        painter.setPen(_dot_pen(color, POINT_DIAMETER))
+        painter.drawPoints(highlighted)
+    painter.restore()
+
+
+def _dot_pen(
+    color: QColor, diameter: float, cap: Qt.PenCapStyle = Qt.PenCapStyle.RoundCap
+) -> QPen:
+    pen = QPen(color)
+    pen.setWidthF(diameter)
+    pen.setCapStyle(cap)
+    return pen
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import Callable
+
+from PyQt6.QtCore import QObject, QThreadPool
+
+from app.logic.kmeans_job import KMeansSnapshot, PreviewResult
+from app.logic.state_manager import StateManager
+from app.ui.board_widget import BoardWidget
+from app.ui.kmeans_worker import PreviewWorker
+from app.ui.toolbar import ToolbarWidget
+
+
+class PreviewController(QObject):
+    def __init__(
+        self,
+        manager: StateManager,
+        board: BoardWidget,
+        toolbar: ToolbarWidget,
+        start_kmeans: Callable[[KMeansSnapshot], None],
+        notify: Callable[[str], None],
+    ) -> None:
+        super().__init__(board)
+        self.manager = manager
+        self.board = board
+        self.toolbar = toolbar
+        self._start_kmeans = start_kmeans
+        self._notify = notify
+        self.live = False
+        self._previewing = False
+        self._stale = False
+        self._worker: PreviewWorker | None = None
+
+    def set_live(self, enabled: bool) -> None:
+        self.live = enabled
+        self._notify(f"Live k-mean preview {'on' if enabled else 'off'}.")
+
+    def request(self) -> None:
+        self._previewing = True
+        if self._worker is not None:
+            self._stale = True
+            return
+        self._stale = False
+        worker = PreviewWorker(self.manager.snapshot_preview())
+        worker.signals.finished.connect(self._show)
+        worker.signals.failed.connect(self._fail)
+        self._worker = worker
+        QThreadPool.globalInstance().start(worker)
+
+    def finish_drag(self) -> None:
+        if self._previewing:
+            self._previewing = False
+            self._start_kmeans(self.manager.snapshot_kmeans(warm_start=self.manager.state.pending_kmeans))
+
+    def _show(self, result: PreviewResult) -> None:
+        self._worker = None
+        if not self._previewing:
+            return
+        previous = self.manager.state.pending_kmeans
+        self.manager.preview_kmeans(result)
+        self.board.update_pending(previous)
+        self.toolbar.set_apply_enabled(False)
+        if self._stale:
+            self.request()
+
+    def _fail(self, message: str) -> None:
+        self._worker = None
+        self.toolbar.show_status(f"K-mean preview failed: {message}")
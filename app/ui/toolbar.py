@@ -2,7 +2,17 @@ from __future__ import annotations
 
 from typing import Callable
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QLabel, QPushButton, QSpinBox, QVBoxLayout, QWidget
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
+    QLabel,
+    QPushButton,
+    QSpinBox,
+    QVBoxLayout,
+    QWidget,
+)
+
+from app.logic.convergence import STOP_CENTER_SHIFT, STOP_REASSIGNMENT, STOP_RELATIVE_SSE, STOP_TIME_BUDGET
 
 
 class ToolbarWidget(QWidget):
@@ -11,11 +21,19 @@ class ToolbarWidget(QWidget):
         on_compute: Callable[[], None],
         on_apply: Callable[[], None],
         on_seed_change: Callable[[int], None],
+        on_kmeans_options_change: Callable[[str, bool, int, str], None] | None = None,
+        on_save_dataset: Callable[[], None] | None = None,
+        on_perf_toggle: Callable[[bool], None] | None = None,
+        on_live_preview_toggle: Callable[[bool], None] | None = None,
     ) -> None:
         super().__init__()
         self._on_compute = on_compute
         self._on_apply = on_apply
         self._on_seed_change = on_seed_change
+        self._on_kmeans_options_change = on_kmeans_options_change
+        self._on_save_dataset = on_save_dataset
+        self._on_perf_toggle = on_perf_toggle
+        self._on_live_preview_toggle = on_live_preview_toggle
         self.status_label = QLabel("")
         self._setup_ui()
 
@@ -37,6 +55,41 @@ class ToolbarWidget(QWidget):
         seed_box.setValue(-1)
         seed_box.valueChanged.connect(self._handle_seed_change)
         layout.addWidget(seed_box)
+        layout.addWidget(QLabel("Engine"))
+        self.engine_box = QComboBox()
+        self.engine_box.addItem("Lloyd", "lloyd")
+        self.engine_box.addItem("Mini-batch", "minibatch")
+        self.engine_box.addItem("Hamerly (exact)", "hamerly")
+        self.engine_box.currentIndexChanged.connect(self._handle_kmeans_options_change)
+        layout.addWidget(self.engine_box)
+        self.plus_plus_box = QCheckBox("k-means++")
+        self.plus_plus_box.toggled.connect(self._handle_kmeans_options_change)
+        layout.addWidget(self.plus_plus_box)
+        layout.addWidget(QLabel("Restarts"))
+        self.restarts_box = QSpinBox()
+        self.restarts_box.setRange(1, 64)
+        self.restarts_box.valueChanged.connect(self._handle_kmeans_options_change)
+        layout.addWidget(self.restarts_box)
+        layout.addWidget(QLabel("Stop when"))
+        self.stopping_box = QComboBox()
+        self.stopping_box.addItem("Centers settle", STOP_CENTER_SHIFT)
+        self.stopping_box.addItem("SSE gain < 0.01%", STOP_RELATIVE_SSE)
+        self.stopping_box.addItem("< 0.1% reassigned", STOP_REASSIGNMENT)
+        self.stopping_box.addItem("1 s budget", STOP_TIME_BUDGET)
+        self.stopping_box.currentIndexChanged.connect(self._handle_kmeans_options_change)
+        layout.addWidget(self.stopping_box)
+        if self._on_live_preview_toggle:
+            self.live_preview_box = QCheckBox("Live preview while dragging")
+            self.live_preview_box.toggled.connect(self._on_live_preview_toggle)
+            layout.addWidget(self.live_preview_box)
+        if self._on_save_dataset:
+            save = QPushButton("Save dataset…")
+            save.clicked.connect(self._on_save_dataset)
+            layout.addWidget(save)
+        if self._on_perf_toggle:
+            self.perf_box = QCheckBox("Perf overlay")
+            self.perf_box.toggled.connect(self._on_perf_toggle)
+            layout.addWidget(self.perf_box)
         layout.addStretch(1)
         layout.addWidget(self.status_label)
 
@@ -46,5 +99,14 @@ class ToolbarWidget(QWidget):
     def _handle_seed_change(self, value: int) -> None:
         self._on_seed_change(value if value >= 0 else -1)
 
+    def _handle_kmeans_options_change(self, *_) -> None:
+        if self._on_kmeans_options_change:
+            self._on_kmeans_options_change(
+                self.engine_box.currentData(),
+                self.plus_plus_box.isChecked(),
+                self.restarts_box.value(),
+                self.stopping_box.currentData(),
+            )
+
     def set_apply_enabled(self, enabled: bool) -> None:
         self.apply_button.setEnabled(enabled)
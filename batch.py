@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from app.logic.experiments import run_batch
+
+
+def main() -> None:
+    base_dir = Path(__file__).resolve().parent
+    parser = argparse.ArgumentParser(description="Run headless explode → calc → apply experiments.")
+    parser.add_argument("--runs", type=int, default=100)
+    parser.add_argument("--cycles", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--config", type=Path, default=base_dir / "config" / "points.json")
+    parser.add_argument("--output", type=Path, default=base_dir / "output" / "batch_results.csv")
+    args = parser.parse_args()
+    summary = run_batch(args.config, args.output, args.runs, args.cycles, args.seed, args.workers)
+    print(
+        f"{summary.runs} runs × {summary.cycles} cycles in {summary.seconds:.2f}s "
+        f"({summary.runs_per_second:.1f} runs/s) → {args.output}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.logic import kmeans_engine  # noqa: E402
+from app.logic.accelerated_kmeans import hamerly  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Compare Lloyd and Hamerly k-means per iteration.")
+    parser.add_argument("--points", type=int, default=100_000)
+    parser.add_argument("--clusters", type=int, nargs="+", default=[10, 50, 100])
+    parser.add_argument("--iterations", type=int, default=30)
+    args = parser.parse_args()
+    rng = np.random.default_rng(0)
+    positions = rng.normal(0.0, 300.0, size=(args.points, 2))
+    for clusters in args.clusters:
+        initial = positions[:clusters].copy()
+        started = time.perf_counter()
+        expected = kmeans_engine.lloyd(positions, initial, args.iterations, 0.0)
+        lloyd_seconds = time.perf_counter() - started
+        evaluations: list[int] = []
+        started = time.perf_counter()
+        accelerated = hamerly(positions, initial, args.iterations, 0.0, evaluations)
+        hamerly_seconds = time.perf_counter() - started
+        fractions = " ".join(f"{count / (args.points * clusters):.2f}" for count in evaluations)
+        print(
+            f"k={clusters}: lloyd {lloyd_seconds:.2f}s, hamerly {hamerly_seconds:.2f}s, "
+            f"identical={np.array_equal(expected[1], accelerated[1])}"
+        )
+        print(f"  distance evaluations per iteration (fraction of n·k): {fractions}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+from PyQt6.QtCore import QPointF, Qt  # noqa: E402
+from PyQt6.QtGui import QColor, QGuiApplication, QImage, QPainter  # noqa: E402
+
+from app.ui.point_renderer import DEFAULT_LOD_THRESHOLD, draw_point_batch  # noqa: E402
+
+
+def per_point(painter: QPainter, screen: np.ndarray, overlap: np.ndarray, color: QColor) -> None:
+    for (x, y), is_overlap in zip(screen.tolist(), overlap.tolist()):
+        radius = 6 if is_overlap else 5
+        painter.setBrush(color)
+        painter.setPen(Qt.GlobalColor.black if is_overlap else color)
+        painter.drawEllipse(QPointF(x, y), radius, radius)
+
+
+def frame_ms(draw, screen: np.ndarray, overlap: np.ndarray, frames: int) -> float:
+    image = QImage(1280, 800, QImage.Format.Format_ARGB32_Premultiplied)
+    color = QColor("#1f77b4")
+    started = time.perf_counter()
+    for _ in range(frames):
+        image.fill(Qt.GlobalColor.white)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        draw(painter, screen, overlap, color)
+        painter.end()
+    return (time.perf_counter() - started) * 1000.0 / frames
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Frame time of per-point vs batched point rendering.")
+    parser.add_argument("--points", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000])
+    parser.add_argument("--frames", type=int, default=5)
+    parser.add_argument("--lod-threshold", type=int, default=DEFAULT_LOD_THRESHOLD)
+    args = parser.parse_args()
+    app = QGuiApplication(sys.argv)  # noqa: F841 - required for painting
+    rng = np.random.default_rng(0)
+    batched = lambda painter, screen, overlap, color: draw_point_batch(
+        painter, screen, overlap, color, args.lod_threshold
+    )
+    full_detail = lambda painter, screen, overlap, color: draw_point_batch(
+        painter, screen, overlap, color, sys.maxsize
+    )
+    print("points   per-point ms   batched ms   batched+LOD ms")
+    for count in args.points:
+        screen = rng.normal((640.0, 400.0), 120.0, size=(count, 2))
+        overlap = np.zeros(count, dtype=bool)
+        overlap[:3] = True
+        print(
+            f"{count:>7}  {frame_ms(per_point, screen, overlap, args.frames):12.2f}  "
+            f"{frame_ms(full_detail, screen, overlap, args.frames):11.2f}  "
+            f"{frame_ms(batched, screen, overlap, args.frames):15.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.logic.clustering import INIT_KMEANS_PLUS_PLUS, KMeansOptions, run_kmeans  # noqa: E402
+from app.models import PointStore  # noqa: E402
+
+
+def blobs(count: int, clusters: int, seed: int) -> PointStore:
+    rng = np.random.default_rng(seed)
+    means = rng.uniform(-400.0, 400.0, size=(clusters, 2))
+    labels = rng.integers(clusters, size=count)
+    return PointStore.from_positions("bench", means[labels] + rng.normal(0.0, 40.0, size=(count, 2)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Wall-clock time of k-means++ restarts per n_init.")
+    parser.add_argument("--points", type=int, default=200_000)
+    parser.add_argument("--clusters", type=int, default=8)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--restarts", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+    points = blobs(args.points, args.clusters, seed=0)
+    centers = [(0.0, 0.0)] * args.clusters
+    print(f"{args.points} points, k={args.clusters}, workers={args.workers}")
+    print("n_init  seconds  best SSE")
+    for n_init in args.restarts:
+        options = KMeansOptions(init=INIT_KMEANS_PLUS_PLUS, n_init=n_init, workers=args.workers)
+        started = time.perf_counter()
+        _, _, score = run_kmeans(points, centers, options=options, seed=0)
+        print(f"{n_init:>6}  {time.perf_counter() - started:7.3f}  {score:.4e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from random import Random
+from typing import Callable, Dict, List
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np  # noqa: E402
+
+from app.logic.clustering import run_kmeans  # noqa: E402
+from app.logic.kmeans_apply import apply_assignments  # noqa: E402
+from app.logic.metrics import clustering_scores  # noqa: E402
+from app.logic.sampling import ParameterBounds, _sample_points, create_group  # noqa: E402
+from app.logic.state_manager import StateManager  # noqa: E402
+
+SIZES = [100, 1_000, 10_000, 100_000, 1_000_000]
+CLUSTERS = [3, 8]
+BOUNDS = ParameterBounds((-200.0, -200.0), (200.0, 200.0), (900.0, 900.0), (2500.0, 2500.0))
+
+Case = Callable[[int, int], Callable[[], object]]
+_APP = None
+
+
+def make_manager(points: int, clusters: int) -> StateManager:
+    rng = Random(0)
+    groups = [
+        create_group(
+            f"g{index}",
+            f"#{rng.randrange(0x1000000):06x}",
+            (rng.uniform(-200.0, 200.0), rng.uniform(-200.0, 200.0)),
+            (rng.uniform(900.0, 2500.0), rng.uniform(900.0, 2500.0)),
+            rng,
+            points // clusters + (index < points % clusters),
+        )
+        for index in range(clusters)
+    ]
+    return StateManager(groups=groups, parameter_bounds=BOUNDS, overlap_radius=120.0, rng=rng)
+
+
+def kmeans_case(points: int, clusters: int) -> Callable[[], object]:
+    manager = make_manager(points, clusters)
+    store = manager._all_points()
+    centers = [group.center_position for group in manager.state.groups]
+    return lambda: run_kmeans(store, centers, seed=0)
+
+
+def metrics_case(points: int, clusters: int) -> Callable[[], object]:
+    rng = np.random.default_rng(0)
+    truth = rng.integers(clusters, size=points)
+    predicted = np.where(rng.random(points) < 0.9, truth, rng.integers(clusters, size=points))
+    return lambda: clustering_scores(truth, predicted)
+
+
+def sampling_case(points: int, clusters: int) -> Callable[[], object]:
+    rng = Random(0)
+    count = points // clusters
+    variance = (1600.0, 1600.0)
+    return lambda: [_sample_points(f"g{index}", (0.0, 0.0), variance, rng, count) for index in range(clusters)]
+
+
+def apply_case(points: int, clusters: int) -> Callable[[], object]:
+    manager = make_manager(points, clusters)
+    groups = manager.state.groups
+    centers, labels, _ = run_kmeans(manager._all_points(), [group.center_position for group in groups], seed=0)
+    return lambda: apply_assignments(groups, centers, labels)
+
+
+def compute_case(points: int, clusters: int) -> Callable[[], object]:
+    manager = make_manager(points, clusters)
+
+    def run() -> object:
+        manager.kmeans_cache.clear()
+        return manager.compute_kmeans()
+
+    return run
+
+
+def paint_case(points: int, clusters: int) -> Callable[[], object]:
+    from PyQt6.QtGui import QImage
+    from PyQt6.QtWidgets import QApplication
+
+    from app.ui.board_widget import BoardWidget
+
+    global _APP
+    _APP = QApplication.instance() or QApplication([sys.argv[0]])
+    manager = make_manager(points, clusters)
+    widget = BoardWidget(
+        state_provider=lambda: manager.state,
+        move_group=manager.move_group,
+        explode_group=manager.regenerate_group,
+        circle_radius=120.0,
+    )
+    widget.resize(1280, 800)
+    image = QImage(widget.size(), QImage.Format.Format_ARGB32_Premultiplied)
+    group_id = manager.state.groups[0].id
+
+    def frame() -> None:
+        manager.move_group(group_id, (1.0, 0.0))
+        widget.render(image)
+
+    return frame
+
+
+CASES: Dict[str, Case] = {
+    "run_kmeans": kmeans_case,
+    "metrics": metrics_case,
+    "sampling": sampling_case,
+    "apply_assignments": apply_case,
+    "compute_kmeans": compute_case,
+    "paint": paint_case,
+}
+
+
+def measure(run: Callable[[], object], repeat: int) -> Dict[str, float]:
+    run()
+    timings = []
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - started)
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    result = run()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    del result
+    blocks = sum(stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0)
+    return {"seconds": statistics.median(timings), "peak_bytes": peak, "retained_blocks": blocks}
+
+
+def run_suite(cases: List[str], sizes: List[int], clusters: List[int], repeat: int) -> List[dict]:
+    results = []
+    for name in cases:
+        for points in sizes:
+            for k in clusters:
+                run = CASES[name](points, k)
+                entry = {"case": name, "points": points, "clusters": k, **measure(run, repeat)}
+                print(
+                    f"{name:>18} n={points:<8} k={k:<3} {entry['seconds'] * 1000:10.2f} ms "
+                    f"peak {entry['peak_bytes'] / 1e6:9.2f} MB  blocks {entry['retained_blocks']}",
+                    flush=True,
+                )
+                results.append(entry)
+    return results
+
+
+def compare(results: List[dict], baseline: dict, threshold: float, min_seconds: float) -> List[str]:
+    key = lambda entry: (entry["case"], entry["points"], entry["clusters"])
+    reference = {key(entry): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        previous = reference.get(key(entry))
+        if previous is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            if metric == "seconds" and max(previous[metric], entry[metric]) < min_seconds:
+                continue
+            if previous[metric] and entry[metric] > previous[metric] * (1.0 + threshold):
+                ratio = entry[metric] / previous[metric]
+                regressions.append(
+                    f"{entry['case']} n={entry['points']} k={entry['clusters']}: {metric} {ratio:.2f}x baseline"
+                )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Wall time and memory of the clustering, metrics, sampling and render paths."
+    )
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES), default=list(CASES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--clusters", type=int, nargs="+", default=CLUSTERS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", type=Path, help="write results as a JSON baseline")
+    parser.add_argument("--compare", type=Path, help="fail when slower than this JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown before failing (0.25 = 25%%)")
+    parser.add_argument("--min-seconds", type=float, default=0.005, help="ignore timings below this noise floor")
+    args = parser.parse_args()
+    results = run_suite(args.cases, args.sizes, args.clusters, args.repeat)
+    if args.save:
+        args.save.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "results": results,
+        }
+        args.save.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = compare(results, baseline, args.threshold, args.min_seconds)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"No regressions beyond {args.threshold:.0%} of {args.compare}.")
+
+
+if __name__ == "__main__":
+    main()
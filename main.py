@@ -1,35 +1,68 @@
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 from random import Random
 
-from PyQt6.QtWidgets import QApplication
-
-from app.config_loader import load_configuration
+from app.config_loader import load_board
+from app.logic.profiling import PROFILER
 from app.logic.state_manager import StateManager
-from app.ui.main_window import MainWindow
+from app.point_import import ImportFields
 
 
 def main() -> None:
-    app = QApplication(sys.argv)
-    rng = Random()
     base_dir = Path(__file__).resolve().parent
-    config_path = base_dir / "config" / "points.json"
-    groups, bounds, circle_radius = load_configuration(config_path, rng)
+    parser = argparse.ArgumentParser(description="Points Cluster Playground")
+    parser.add_argument(
+        "source",
+        nargs="?",
+        type=Path,
+        default=base_dir / "config" / "points.json",
+        help="JSON group configuration, .ppd point dataset, or .csv/.ndjson point dump",
+    )
+    parser.add_argument("--x-column", default="x")
+    parser.add_argument("--y-column", default="y")
+    parser.add_argument("--label-column", default="label")
+    parser.add_argument("--color-column", default="color")
+    parser.add_argument("--profile", type=Path, help="record span timings and dump them as JSON on exit")
+    args, qt_args = parser.parse_known_args()
+    from PyQt6.QtWidgets import QApplication, QProgressDialog
+
+    from app.ui.main_window import MainWindow
+
+    app = QApplication([sys.argv[0], *qt_args])
+    rng = Random()
+    fields = ImportFields(args.x_column, args.y_column, args.label_column, args.color_column)
+    progress = QProgressDialog(f"Loading {args.source.name}…", "", 0, 1000)
+    progress.setCancelButton(None)
+    progress.setMinimumDuration(500)
+
+    def report(done: int, total: int) -> None:
+        progress.setValue(min(999, done * 1000 // max(total, 1)))
+        app.processEvents()
+
+    groups, bounds, circle_radius, generated = load_board(args.source, rng, fields, on_progress=report)
+    progress.close()
     manager = StateManager(
         groups=groups,
         parameter_bounds=bounds,
         overlap_radius=circle_radius,
         rng=rng,
+        jitter_overlap=generated,
     )
     window = MainWindow(
         manager=manager,
         circle_radius=circle_radius,
         screenshot_dir=base_dir / "output",
     )
+    if args.profile:
+        window.toolbar.perf_box.setChecked(True)
     window.show()
-    sys.exit(app.exec())
+    status = app.exec()
+    if args.profile:
+        PROFILER.dump(args.profile)
+    sys.exit(status)
 
 
 if __name__ == "__main__":
@@ -1,6 +1,23 @@
 import sys
 from pathlib import Path
+from random import Random
+
+import pytest
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
+CONFIG = ROOT / "config" / "points.json"
+
+
+@pytest.fixture
+def build_manager():
+    from app.config_loader import load_configuration
+    from app.logic.state_manager import StateManager
+
+    def build(seed: int = 0) -> StateManager:
+        rng = Random(seed)
+        groups, bounds, radius = load_configuration(CONFIG, rng)
+        return StateManager(groups=groups, parameter_bounds=bounds, overlap_radius=radius, rng=rng)
+
+    return build
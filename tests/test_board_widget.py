@@ -0,0 +1,50 @@
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+from PyQt6.QtCore import QPoint, Qt
+from PyQt6.QtGui import QRegion
+from PyQt6.QtTest import QTest
+
+from app.ui import coordinates
+from app.ui.board_widget import BoardWidget
+
+
+def find(manager, group_id):
+    return next(group for group in manager.state.groups if group.id == group_id)
+
+
+@pytest.fixture(scope="module")
+def qapp():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_drag_moves_are_coalesced_per_frame(qapp, build_manager):
+    manager = build_manager(0)
+    moves = []
+
+    def move_group(group_id, delta):
+        moves.append((group_id, delta))
+        manager.move_group(group_id, delta)
+
+    widget = BoardWidget(lambda: manager.state, move_group, lambda group_id: None, 120.0)
+    widget.resize(800, 600)
+    regions = []
+    widget.update = lambda *area: regions.append(QRegion(*area) if area else None)
+    red = find(manager, "red")
+    origin = red.center_position
+    start = coordinates.to_screen(red.center_position, coordinates.origin(800, 600)).toPoint()
+    before = widget._envelopes()
+    QTest.mousePress(widget, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, start)
+    for step in range(1, 5):
+        QTest.mouseMove(widget, start + QPoint(5 * step, 0))
+    assert len(moves) == 1
+    assert len(regions) == 1 and regions[0] is not None
+    assert regions[0].boundingRect() == before["red"][2].united(widget._envelopes()["red"][2])
+    assert not regions[0].boundingRect().contains(widget.rect())
+    QTest.mouseRelease(widget, Qt.MouseButton.LeftButton, Qt.KeyboardModifier.NoModifier, start + QPoint(20, 0))
+    assert [delta for _, delta in moves] == [(5.0, 0.0), (15.0, 0.0)]
+    moved = find(manager, "red").center_position
+    assert moved == pytest.approx((origin[0] + 20.0, origin[1]))
@@ -1,5 +1,9 @@
-from app.logic.clustering import run_kmeans
-from app.models import Point
+import numpy as np
+import pytest
+
+from app.logic.clustering import ENGINE_HAMERLY, INIT_KMEANS_PLUS_PLUS, KMeansOptions, assignments_by_id, run_kmeans
+from app.logic.kmeans_apply import apply_assignments
+from app.models import Group, Point, PointStore
 
 
 def test_kmeans_groups_points_by_proximity():
@@ -11,12 +15,67 @@ def test_kmeans_groups_points_by_proximity():
         Point(id="c0", position=(20.2, 20.1), original_group_id="c"),
         Point(id="c1", position=(20.5, 19.9), original_group_id="c"),
     ]
-    centers, assignments, score = run_kmeans(points, [(0.0, 0.0), (10.0, 10.0), (20.0, 20.0)])
+    centers, labels, score = run_kmeans(points, [(0.0, 0.0), (10.0, 10.0), (20.0, 20.0)])
     assert len(centers) == 3
     assert score > 0
+    assert labels.dtype == np.int32 and len(labels) == len(points)
+    assignments = assignments_by_id(points, labels)
     groups = {index: [] for index in range(3)}
     for point in points:
         groups[assignments[point.id]].append(point.id[0])
     assert len(groups[0]) >= 2
     assert len(groups[1]) >= 2
     assert len(groups[2]) >= 2
+
+
+def test_kmeans_empty_cluster_recenters_to_origin():
+    points = [
+        Point(id=f"a{index}", position=(5.0 + index, 5.0), original_group_id="a")
+        for index in range(4)
+    ]
+    centers, labels, score = run_kmeans(points, [(6.0, 5.0), (500.0, 500.0), (-500.0, 0.0)])
+    assert centers[0] == (6.5, 5.0)
+    assert centers[1] == (0.0, 0.0)
+    assert labels.tolist() == [0, 0, 0, 0]
+    assert score == 5.0
+
+
+def test_restarts_are_deterministic_and_keep_best_score():
+    points = [
+        Point(id=f"p-{index}", position=((index % 5) * 30.0 + index * 0.1, (index % 3) * 40.0), original_group_id="p")
+        for index in range(60)
+    ]
+    start = [(0.0, 0.0), (1.0, 0.0), (2.0, 0.0)]
+    _, _, single = run_kmeans(points, start)
+    options = KMeansOptions(init=INIT_KMEANS_PLUS_PLUS, n_init=6, workers=3)
+    first = run_kmeans(points, start, options=options, seed=11)
+    second = run_kmeans(points, start, options=options, seed=11)
+    assert first[0] == second[0] and first[2] == second[2]
+    assert np.array_equal(first[1], second[1])
+    _, _, best = run_kmeans(points, start, options=KMeansOptions(n_init=6), seed=11)
+    assert best <= single
+
+
+def test_hamerly_engine_matches_lloyd_for_many_clusters():
+    points = [
+        Point(id=f"p-{index}", position=((index * 37) % 101 * 3.0, (index * 53) % 97 * 2.0), original_group_id="p")
+        for index in range(400)
+    ]
+    expected = run_kmeans(points, n_clusters=25, epsilon=0.0)
+    accelerated = run_kmeans(points, n_clusters=25, epsilon=0.0, options=KMeansOptions(engine=ENGINE_HAMERLY))
+    assert len(expected[0]) == 25
+    assert accelerated[0] == expected[0] and accelerated[2] == expected[2]
+    assert np.array_equal(accelerated[1], expected[1])
+
+
+def test_apply_assignments_follows_rows_even_when_point_ids_collide():
+    def group(group_id: str, xs: list) -> Group:
+        positions = np.array([(x, 0.0) for x in xs])
+        return Group(group_id, "#000000", (0.0, 0.0), (1.0, 1.0), PointStore.from_positions("a", positions))
+
+    groups = [group("left", [0.0, 11.0]), group("right", [10.0, 1.0])]
+    updated = apply_assignments(groups, [(0.5, 0.0), (10.5, 0.0)], np.array([0, 1, 1, 0], dtype=np.int32))
+    assert updated[0].points.positions[:, 0].tolist() == [0.0, 1.0]
+    assert updated[1].points.positions[:, 0].tolist() == [11.0, 10.0]
+    with pytest.raises(ValueError):
+        apply_assignments(groups, [(0.5, 0.0), (10.5, 0.0)], np.zeros(3, dtype=np.int32))
@@ -0,0 +1,21 @@
+import json
+from random import Random
+
+from app.config_loader import load_configuration
+
+
+def test_configuration_honours_per_group_point_counts(tmp_path):
+    config = {
+        "point_count": 4,
+        "groups": [
+            {"id": f"g{index}", "color": "#000000", "mean": [index * 50.0, 0.0], "variance": [1.0, 1.0]}
+            for index in range(5)
+        ],
+    }
+    config["groups"][2]["point_count"] = 1000
+    path = tmp_path / "points.json"
+    path.write_text(json.dumps(config), encoding="utf-8")
+    groups, _, _ = load_configuration(path, Random(0))
+    assert [len(group.points) for group in groups] == [4, 4, 1000, 4, 4]
+    again, _, _ = load_configuration(path, Random(0))
+    assert (groups[2].points.positions == again[2].points.positions).all()
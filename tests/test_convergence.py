@@ -0,0 +1,65 @@
+import numpy as np
+import pytest
+
+from app.logic.clustering import ENGINE_HAMERLY, KMeansOptions, run_kmeans
+from app.logic.convergence import ReassignmentFraction, RelativeImprovement, TimeBudget
+from app.models import PointStore
+
+
+def blobs(count: int) -> PointStore:
+    rng = np.random.default_rng(5)
+    means = rng.uniform(-500.0, 500.0, size=(6, 2))
+    return PointStore.from_positions("p", means[np.arange(count) % 6] + rng.normal(0.0, 60.0, size=(count, 2)))
+
+
+INITIAL = [(0.0, 0.0), (100.0, 0.0), (0.0, 100.0), (-100.0, 0.0), (0.0, -100.0), (50.0, 50.0)]
+
+
+def test_trace_records_every_lloyd_iteration():
+    points = blobs(6000)
+    trace = []
+    _, _, score = run_kmeans(points, INITIAL, max_iterations=100, epsilon=0.0, trace=trace)
+    assert trace[0].reassigned == len(points)
+    assert trace[-1].reassigned == 0
+    assert [stats.iteration for stats in trace] == list(range(len(trace)))
+    sse = [stats.sse for stats in trace]
+    assert all(later <= earlier + 1e-6 for earlier, later in zip(sse, sse[1:]))
+    assert sse[-1] == pytest.approx(score)
+    seconds = [stats.seconds for stats in trace]
+    assert seconds == sorted(seconds)
+
+
+def test_hamerly_trace_matches_lloyd():
+    points = blobs(6000)
+    lloyd_trace, hamerly_trace = [], []
+    run_kmeans(points, INITIAL, max_iterations=100, epsilon=0.0, trace=lloyd_trace)
+    options = KMeansOptions(engine=ENGINE_HAMERLY)
+    run_kmeans(points, INITIAL, max_iterations=100, epsilon=0.0, options=options, trace=hamerly_trace)
+    assert [stats.reassigned for stats in hamerly_trace] == [stats.reassigned for stats in lloyd_trace]
+    assert [stats.sse for stats in hamerly_trace] == pytest.approx([stats.sse for stats in lloyd_trace])
+
+
+def test_hamerly_trace_skips_sse_unless_requested():
+    points = blobs(6000)
+    trace = []
+    options = KMeansOptions(engine=ENGINE_HAMERLY)
+    run_kmeans(points, INITIAL, max_iterations=100, epsilon=0.0, options=options, trace=trace, record_sse=False)
+    assert all(np.isnan(stats.sse) for stats in trace)
+    assert trace[-1].reassigned == 0
+    trace.clear()
+    options = KMeansOptions(engine=ENGINE_HAMERLY, stopping=(RelativeImprovement(1e-3),))
+    run_kmeans(points, INITIAL, max_iterations=100, options=options, trace=trace, record_sse=False)
+    assert all(np.isfinite(stats.sse) for stats in trace)
+
+
+@pytest.mark.parametrize(
+    "policy", [RelativeImprovement(0.05), ReassignmentFraction(0.05), TimeBudget(0.0)], ids=repr
+)
+def test_stopping_policies_end_runs_early(policy):
+    points = blobs(6000)
+    full, early = [], []
+    run_kmeans(points, INITIAL, max_iterations=100, epsilon=0.0, trace=full)
+    options = KMeansOptions(stopping=(policy,))
+    run_kmeans(points, INITIAL, max_iterations=100, options=options, trace=early)
+    assert len(early) < len(full)
+    assert policy.should_stop(early, len(points))
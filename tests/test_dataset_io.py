@@ -0,0 +1,55 @@
+from random import Random
+
+import numpy as np
+
+from app.config_loader import load_board
+from app.dataset_io import load_dataset
+from app.logic.state_manager import StateManager
+
+
+def reopen(path):
+    rng = Random(0)
+    groups, bounds, radius, generated = load_board(path, rng)
+    return StateManager(groups=groups, parameter_bounds=bounds, overlap_radius=radius, rng=rng, jitter_overlap=generated)
+
+
+def test_saved_board_round_trips_through_memory_map(tmp_path, build_manager):
+    manager = build_manager(2)
+    manager.move_group("red", (12.0, -3.0))
+    manager.compute_kmeans()
+    manager.apply_kmeans()
+    path = tmp_path / "board.ppd"
+    manager.save_dataset(path)
+
+    reopened = reopen(path)
+    loaded = reopened.state.groups
+    assert (reopened.bounds, reopened.overlap_radius) == (manager.bounds, manager.overlap_radius)
+    for original, restored in zip(manager.state.groups, loaded):
+        assert restored.id == original.id and restored.color == original.color
+        assert restored.center_position == original.center_position
+        assert restored.points.ids() == original.points.ids()
+        assert np.array_equal(restored.points.positions, original.points.positions)
+        assert np.array_equal(restored.points.overlap, original.points.overlap)
+        assert restored.stats == original.stats
+    assert isinstance(loaded[0].points.positions.base, np.memmap)
+
+
+def test_edits_to_a_loaded_board_do_not_touch_the_file(tmp_path, build_manager):
+    path = tmp_path / "board.ppd"
+    build_manager(3).save_dataset(path)
+    loaded, _, _ = load_dataset(path)
+    before = loaded[0].points.positions.copy()
+    loaded[0].translate(100.0, 0.0)
+    assert np.array_equal(load_dataset(path)[0][0].points.positions, before)
+
+
+def test_saving_over_the_loaded_file_keeps_it_readable(tmp_path, build_manager):
+    path = tmp_path / "board.ppd"
+    build_manager(4).save_dataset(path)
+    manager = reopen(path)
+    manager.move_group("red", (25.0, 5.0))
+    expected = [group.points.positions.copy() for group in manager.state.groups]
+    manager.save_dataset(path)
+    for group, positions in zip(reopen(path).state.groups, expected):
+        assert np.array_equal(group.points.positions, positions)
+    assert [entry.name for entry in tmp_path.iterdir()] == ["board.ppd"]
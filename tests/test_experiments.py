@@ -0,0 +1,23 @@
+import csv
+from pathlib import Path
+
+from app.logic.experiments import run_batch, run_experiment, run_seeds
+
+CONFIG = Path(__file__).resolve().parents[1] / "config" / "points.json"
+
+
+def test_experiment_is_deterministic_per_seed():
+    first = run_experiment(CONFIG, 3, 0, 1234)
+    second = run_experiment(CONFIG, 3, 0, 1234)
+    assert first == second
+    assert [result.cycle for result in first] == [0, 1, 2]
+
+
+def test_batch_streams_one_row_per_cycle(tmp_path):
+    output = tmp_path / "results.csv"
+    summary = run_batch(CONFIG, output, runs=4, cycles=2, base_seed=7, workers=2)
+    with output.open(newline="", encoding="utf-8") as handle:
+        rows = list(csv.DictReader(handle))
+    assert len(rows) == 8
+    assert [int(row["seed"]) for row in rows[::2]] == run_seeds(7, 4)
+    assert summary.runs_per_second > 0
@@ -0,0 +1,21 @@
+from random import Random
+
+from app.logic.sampling import create_group
+from app.ui.geometry_cache import GeometryCache
+
+
+def test_geometry_is_cached_per_group_version():
+    red = create_group("red", "#ff0000", (0.0, 0.0), (900.0, 900.0), Random(0))
+    blue = create_group("blue", "#0000ff", (100.0, 0.0), (900.0, 900.0), Random(1))
+    cache = GeometryCache()
+    first = cache.geometry(red, 1)
+    assert cache.geometry(red, 1) is first
+    red.translate(500.0, 0.0)
+    moved = cache.geometry(red, 2)
+    assert moved is not first
+    assert cache.screen_positions(red, 2, (10.0, 20.0))[0, 0] == 10.0 + red.points.positions[0, 0]
+    cache.geometry(blue, 1)
+    assert (cache.hits, cache.misses) == (2, 3)
+    cache.retain(["blue"])
+    assert cache.stats()["entries"] == 1
+    assert cache.geometry(red, 2) is not moved
@@ -0,0 +1,54 @@
+import numpy as np
+
+from app.logic.history import History
+from app.logic.state_manager import StateManager
+
+
+def positions(manager: StateManager) -> list:
+    return [group.points.positions.copy() for group in manager.state.groups]
+
+
+def test_undo_and_redo_restore_moves_regenerates_and_applies(build_manager):
+    manager = build_manager(4)
+    states = [positions(manager)]
+    manager.move_group("blue", (10.0, 0.0))
+    manager.move_group("blue", (5.0, 5.0))
+    manager.end_interaction()
+    states.append(positions(manager))
+    manager.regenerate_group("red")
+    states.append(positions(manager))
+    manager.compute_kmeans()
+    manager.apply_kmeans()
+    states.append(positions(manager))
+    assert [label for label, _ in manager.history_steps()] == ["move blue", "regenerate red", "apply k-means"]
+    for expected in reversed(states[:-1]):
+        assert manager.undo()
+        assert all(np.array_equal(a, b) for a, b in zip(positions(manager), expected))
+    assert manager.undo() is None
+    for expected in states[1:]:
+        assert manager.redo()
+        assert all(np.array_equal(a, b) for a, b in zip(positions(manager), expected))
+    assert manager.redo() is None
+
+
+def test_snapshots_share_untouched_groups(build_manager):
+    manager = build_manager(4)
+    blue = next(group for group in manager.state.groups if group.id == "blue")
+    before = manager.state.groups[:]
+    manager.move_group("blue", (3.0, 0.0))
+    after = manager.state.groups
+    assert sum(old is new for old, new in zip(before, after)) == len(before) - 1
+    assert manager.history_steps() == [("move blue", blue.points.positions.nbytes)]
+    manager.undo()
+    assert all(old is new for old, new in zip(before, manager.state.groups))
+
+
+def test_history_is_bounded_by_steps(build_manager):
+    manager = build_manager(4)
+    manager.history.max_steps = 3
+    for step in range(6):
+        manager.regenerate_group("green")
+    assert len(manager.history_steps()) == 3
+    manager.history = History(max_steps=10, max_bytes=0)
+    manager.regenerate_group("green")
+    assert manager.history_steps() == []
@@ -0,0 +1,53 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+HEADLESS_MODULES = (
+    "app.config_loader",
+    "app.dataset_io",
+    "app.point_import",
+    "app.logic.state_manager",
+    "app.logic.experiments",
+    "app.logic.screenshot_service",
+    "app.ui.geometry_cache",
+)
+HEADLESS_BUDGET = 1.0
+GUI_BUDGET = 2.5
+
+
+def import_profile(statement: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total, name = line.split("|")
+        top_level = not name[1:].startswith(" ")
+        cumulative[name.strip()] = (int(total) / 1_000_000, top_level)
+    return cumulative
+
+
+def top_level_seconds(profile: dict, prefix: str) -> float:
+    return sum(seconds for name, (seconds, top) in profile.items() if top and name.startswith(prefix))
+
+
+def test_headless_modules_load_without_qt():
+    blocked = "import sys; sys.modules['PyQt6'] = None; " + "; ".join(f"import {name}" for name in HEADLESS_MODULES)
+    profile = import_profile(blocked)
+    assert not [name for name in profile if name.startswith("PyQt6")]
+    assert top_level_seconds(profile, "app.") < HEADLESS_BUDGET
+
+
+def test_gui_import_stays_within_budget():
+    pytest.importorskip("PyQt6.QtWidgets")
+    profile = import_profile("import app.ui.main_window")
+    assert top_level_seconds(profile, "app.ui.main_window") < GUI_BUDGET
@@ -0,0 +1,82 @@
+import pytest
+
+from app.logic.clustering import INIT_KMEANS_PLUS_PLUS, KMeansOptions
+from app.logic.kmeans_job import KMeansCancelled, run_job, run_preview
+from app.logic.result_cache import ResultCache
+
+
+def test_result_is_discarded_after_state_changes(build_manager):
+    manager = build_manager(5)
+    snapshot = manager.snapshot_kmeans()
+    manager.move_group("blue", (25.0, 0.0))
+    result = run_job(snapshot)
+    assert not manager.accept_kmeans(result)
+    assert manager.state.pending_kmeans == []
+    assert manager.accept_kmeans(run_job(manager.snapshot_kmeans()))
+    assert manager.state.pending_kmeans
+
+
+def test_job_reports_progress_and_honours_cancellation(build_manager):
+    manager = build_manager(5)
+    iterations = []
+    run_job(manager.snapshot_kmeans(), on_iteration=lambda index, shift: iterations.append(index))
+    assert iterations and iterations[0] == 0
+    with pytest.raises(KMeansCancelled):
+        run_job(manager.snapshot_kmeans(), is_cancelled=lambda: True)
+
+
+def test_preview_warm_starts_from_pending_centers_and_blocks_apply(build_manager):
+    manager = build_manager(5)
+    manager.compute_kmeans()
+    converged = manager.state.pending_kmeans
+    snapshot = manager.snapshot_preview(sample=200)
+    assert len(snapshot.positions) <= 200
+    assert snapshot.centers.tolist() == [list(center) for center in converged]
+    manager.move_group("blue", (30.0, 0.0))
+    manager.preview_kmeans(run_preview(manager.snapshot_preview(), iterations=2))
+    assert manager.state.pending_kmeans != converged
+    groups = manager.state.groups
+    manager.apply_kmeans()
+    assert manager.state.groups is groups
+    refined = manager.snapshot_kmeans(warm_start=manager.state.pending_kmeans)
+    assert refined.initial_centers == manager.state.pending_kmeans
+
+
+def test_repeated_calcs_are_served_from_the_cache(build_manager):
+    manager = build_manager(5)
+    first = manager.compute_kmeans()
+    again = manager.compute_kmeans()
+    assert again[1] is first[1] and again[0] == first[0]
+    assert manager.kmeans_cache.stats()["hits"] == 1
+    manager.move_group("blue", (40.0, 0.0))
+    moved = manager.compute_kmeans()
+    assert moved[0] != first[0]
+    assert manager.kmeans_cache.stats()["misses"] == 2
+    manager.apply_kmeans()
+    manager.compute_kmeans()
+    assert manager.kmeans_cache.stats()["misses"] == 3
+
+
+def test_seeded_randomized_calcs_reuse_their_seed_and_cache_entry(build_manager):
+    manager = build_manager(5)
+    manager.set_seed(5)
+    manager.set_kmeans_options(KMeansOptions(init=INIT_KMEANS_PLUS_PLUS, n_init=4))
+    for _ in range(3):
+        manager.compute_kmeans()
+    assert manager.kmeans_cache.stats()["hits"] == 2
+    assert len(manager.kmeans_cache) == 1
+    manager.set_seed(None)
+    manager.compute_kmeans()
+    manager.compute_kmeans()
+    assert len(manager.kmeans_cache) == 1
+    assert manager.kmeans_cache.stats()["hits"] == 2
+
+
+def test_cache_evicts_least_recent_entries_within_its_byte_cap():
+    cache = ResultCache(max_entries=4, max_bytes=100)
+    for key in "abc":
+        cache.put(key, key.upper(), 40)
+    assert cache.get("a") is None and cache.get("b") == "B"
+    cache.put("d", "D", 40)
+    assert cache.get("c") is None and cache.get("b") == "B"
+    assert cache.stats()["bytes"] == 80
@@ -0,0 +1,27 @@
+import numpy as np
+import pytest
+
+from app.logic.metrics import clustering_scores, contingency_matrix
+
+
+def test_scores_match_reference_values():
+    truth = [0, 0, 0, 1, 1, 1, 2, 2, 2]
+    predicted = [0, 0, 1, 1, 1, 2, 2, 2, 2]
+    scores = clustering_scores(truth, predicted)
+    assert scores.v_measure == pytest.approx(0.5895098274473048)
+    assert scores.ari == pytest.approx(0.35714285714285715)
+    assert scores.nmi == pytest.approx(0.5895098274473048)
+    assert 0.0 < scores.homogeneity < 1.0
+    assert 0.0 < scores.completeness < 1.0
+
+
+def test_relabelled_partition_scores_perfectly():
+    truth = np.repeat([0, 1, 2], 1_000_000)
+    predicted = np.repeat([7, 3, 5], 1_000_000)
+    assert contingency_matrix(truth, predicted).tolist() == [
+        [0, 0, 1_000_000],
+        [1_000_000, 0, 0],
+        [0, 1_000_000, 0],
+    ]
+    scores = clustering_scores(truth, predicted)
+    assert (scores.v_measure, scores.ari, scores.nmi) == (1.0, 1.0, 1.0)
@@ -0,0 +1,42 @@
+import numpy as np
+
+from app.logic import kmeans_engine
+from app.logic.minibatch_kmeans import run_minibatch_kmeans
+
+
+def blobs(count: int) -> np.ndarray:
+    rng = np.random.default_rng(3)
+    means = np.array([[-300.0, 0.0], [300.0, 0.0], [0.0, 400.0]])
+    return means[np.arange(count) % 3] + rng.normal(0.0, 20.0, size=(count, 2))
+
+
+def test_chunked_source_matches_full_lloyd_partition():
+    positions = blobs(30_000)
+    initial = positions[:3].copy()
+    source = lambda: (positions[start : start + 7_001] for start in range(0, len(positions), 7_001))
+    centers, labels, score = run_minibatch_kmeans(source, initial, batch_size=512)
+    _, full_labels, full_score = kmeans_engine.lloyd(positions, initial)
+    assert labels.shape == (30_000,)
+    assert np.array_equal(labels, full_labels)
+    assert score <= full_score * 1.01
+
+
+def test_array_source_is_deterministic_for_a_generator_seed():
+    positions = blobs(5_000)
+    first = run_minibatch_kmeans(positions, positions[:3], rng=np.random.default_rng(9))
+    second = run_minibatch_kmeans(positions, positions[:3], rng=np.random.default_rng(9))
+    assert np.array_equal(first[0], second[0])
+    assert np.array_equal(first[1], second[1])
+
+
+def test_progress_reports_the_center_shift_at_each_checkpoint():
+    positions = blobs(20_000)
+    initial = positions[:3].copy()
+    reported = []
+    run_minibatch_kmeans(
+        positions, initial, batch_size=256, rng=np.random.default_rng(2), on_iteration=lambda *args: reported.append(args)
+    )
+    steps, shifts = zip(*reported)
+    assert all(step % 10 == 0 for step in steps)
+    assert shifts[0] > 10.0
+    assert min(shifts) < 5.0
@@ -1,6 +1,9 @@
 from random import Random
 
-from app.logic.overlap_manager import OVERLAP_COUNT, enforce_overlap
+import numpy as np
+import pytest
+
+from app.logic.overlap_manager import OVERLAP_COUNT, OverlapEngine, enforce_overlap
 from app.models import Group, Point
 
 
@@ -25,3 +28,57 @@ def test_enforce_overlap_marks_expected_points():
     for group in groups:
         overlap_flags = [point.is_overlap for point in group.points[:OVERLAP_COUNT]]
         assert all(overlap_flags)
+
+
+def test_engine_tracks_the_center_incrementally_without_rng_draws_on_moves():
+    groups = [build_group("blue"), build_group("green"), build_group("red")]
+    engine = OverlapEngine(radius=100.0)
+    rng = Random(3)
+    engine.reset(groups, rng)
+    state = rng.getstate()
+    members = [group.points.positions[:OVERLAP_COUNT] - engine.center for group in groups]
+    rest = [group.points.positions[OVERLAP_COUNT:].copy() for group in groups]
+    groups[0].translate(30.0, -12.0)
+    assert engine.group_moved(groups, "blue", (30.0, -12.0)) == ["blue", "green", "red"]
+    assert engine.center == pytest.approx((10.0, -4.0))
+    assert rng.getstate() == state
+    for group, offsets in zip(groups, members):
+        assert np.allclose(group.points.positions[:OVERLAP_COUNT] - engine.center, offsets)
+    assert np.array_equal(groups[1].points.positions[OVERLAP_COUNT:], rest[1])
+    mean = groups[1].stats.mean()
+    assert mean == pytest.approx(tuple(groups[1].points.positions.mean(axis=0)))
+
+
+def test_state_manager_overlap_moves_are_undoable(build_manager):
+    manager = build_manager(8)
+    radius = manager.overlap_radius
+    manager.set_overlap_enabled(True)
+    manager.end_interaction()
+    before = [group.points.positions.copy() for group in manager.state.groups]
+    manager.move_group("blue", (20.0, 5.0))
+    manager.regenerate_group("red")
+    centers = [group.center_position for group in manager.state.groups]
+    expected = np.mean(centers, axis=0)
+    for group in manager.state.groups:
+        offsets = group.points.positions[:OVERLAP_COUNT] - expected
+        assert (np.hypot(offsets[:, 0], offsets[:, 1]) <= radius * 0.3 + 1e-9).all()
+    manager.undo()
+    manager.undo()
+    assert all(np.array_equal(group.points.positions, old) for group, old in zip(manager.state.groups, before))
+
+
+def test_undoing_enable_overlap_restores_masks_and_mode(build_manager):
+    manager = build_manager(8)
+    manager.compute_kmeans()
+    manager.apply_kmeans()
+    masks = [np.flatnonzero(group.points.overlap).tolist() for group in manager.state.groups]
+    manager.set_overlap_enabled(True)
+    assert manager.history_steps()[-1][0] == "enable overlap"
+    manager.undo()
+    assert [np.flatnonzero(group.points.overlap).tolist() for group in manager.state.groups] == masks
+    manager.redo()
+    assert all(np.flatnonzero(group.points.overlap).tolist() == [0, 1, 2] for group in manager.state.groups)
+    manager.undo()
+    others = [group.points.positions.copy() for group in manager.state.groups[1:]]
+    manager.move_group(manager.state.groups[0].id, (15.0, 0.0))
+    assert all(np.array_equal(group.points.positions, old) for group, old in zip(manager.state.groups[1:], others))
@@ -0,0 +1,57 @@
+import json
+from random import Random
+
+import numpy as np
+import pytest
+
+from app.config_loader import load_board
+from app.logic.state_manager import StateManager
+from app.point_import import PALETTE, ImportFields, import_points
+
+
+def test_csv_rows_are_grouped_by_label_across_chunks(tmp_path):
+    path = tmp_path / "points.csv"
+    rows = [(1.0, 2.0, "a", "#000000"), (3.0, 4.0, "b", ""), (5.0, 6.0, "a", "#ffffff"), (7.0, 8.0, "b", "")]
+    path.write_text("﻿x,y,label,color\n" + "".join(f"{x},{y},{l},{c}\n" for x, y, l, c in rows), encoding="utf-8")
+    progress = []
+    groups = import_points(path, chunk_rows=3, on_progress=lambda done, total: progress.append((done, total)))
+    assert [(group.id, group.color) for group in groups] == [("a", "#000000"), ("b", PALETTE[1])]
+    assert groups[0].points.positions.tolist() == [[1.0, 2.0], [5.0, 6.0]]
+    assert groups[1].points.ids() == ["b-0", "b-1"]
+    assert groups[1].center_position == (5.0, 6.0)
+    assert groups[1].variance == pytest.approx((4.0, 4.0))
+    assert progress[-1] == (path.stat().st_size, path.stat().st_size)
+
+
+def test_ndjson_import_matches_groupwise_statistics(tmp_path):
+    rng = np.random.default_rng(0)
+    positions = rng.normal(100.0, 20.0, size=(500, 2))
+    labels = rng.integers(0, 3, 500)
+    path = tmp_path / "points.ndjson"
+    lines = (json.dumps({"px": x, "py": y, "cls": int(c)}) for (x, y), c in zip(positions.tolist(), labels.tolist()))
+    path.write_text("\n".join(lines) + "\n\n", encoding="utf-8")
+    groups, _, _, _ = load_board(path, Random(0), ImportFields(x="px", y="py", label="cls"))
+    for group in groups:
+        expected = positions[labels == int(group.id)]
+        assert np.array_equal(group.points.positions, expected)
+        assert group.stats.mean() == pytest.approx(tuple(expected.mean(axis=0)))
+        assert group.variance == pytest.approx(tuple(expected.var(axis=0)))
+
+
+def test_imported_boards_are_not_jittered(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text("x,y,label\n" + "".join(f"{i},{i * 2},{i % 2}\n" for i in range(20)), encoding="utf-8")
+    rng = Random(0)
+    groups, bounds, radius, generated = load_board(path, rng)
+    before = [(group.points.positions.copy(), group.points.overlap.copy()) for group in groups]
+    manager = StateManager(groups=groups, parameter_bounds=bounds, overlap_radius=radius, rng=rng, jitter_overlap=generated)
+    for group, (positions, overlap) in zip(manager.state.groups, before):
+        assert np.array_equal(group.points.positions, positions)
+        assert np.array_equal(group.points.overlap, overlap)
+
+
+def test_csv_without_label_column_is_rejected(tmp_path):
+    path = tmp_path / "points.csv"
+    path.write_text("x,y\n1,2\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="label"):
+        import_points(path)
@@ -0,0 +1,57 @@
+from random import Random
+
+import numpy as np
+
+from app.logic.overlap_manager import enforce_overlap
+from app.models import Group, Point, PointStore
+
+
+def test_group_converts_points_into_store_views():
+    group = Group(
+        id="blue",
+        color="#000000",
+        mean=(0.0, 0.0),
+        variance=(1.0, 1.0),
+        points=[Point(id=f"blue-{index}", position=(index, 0.0), original_group_id="blue") for index in range(4)],
+    )
+    assert isinstance(group.points, PointStore)
+    view = group.points[2]
+    assert view.id == "blue-2"
+    view.position = (5.0, 6.0)
+    view.is_overlap = True
+    assert group.points.positions[2].tolist() == [5.0, 6.0]
+    assert group.points.overlap.tolist() == [False, False, True, False]
+
+
+def test_translate_and_concat_keep_point_identity():
+    blue = PointStore.from_positions("blue", np.zeros((2, 2)))
+    red = PointStore.from_positions("red", np.ones((3, 2)))
+    blue.translate(2.0, -1.0)
+    merged = PointStore.concat([blue, red])
+    assert merged.ids() == ["blue-0", "blue-1", "red-0", "red-1", "red-2"]
+    assert merged.positions[:2].tolist() == [[2.0, -1.0], [2.0, -1.0]]
+    assert merged.take(np.array([4, 0])).ids() == ["red-2", "blue-0"]
+
+
+def test_store_stays_compact_per_point():
+    store = PointStore.from_positions("blue", np.zeros((1_000_000, 2)))
+    assert store.nbytes <= 26 * 1_000_000
+
+
+def test_group_stats_track_moves_and_overlap_edits():
+    rng = np.random.default_rng(4)
+    group = Group(
+        id="blue",
+        color="#000000",
+        mean=(10.0, -5.0),
+        variance=(1.0, 1.0),
+        points=PointStore.from_positions("blue", rng.normal(0.0, 30.0, size=(5_000, 2))),
+        center_position=(10.0, -5.0),
+    )
+    for step in range(200):
+        group.translate(1.5, -0.5 * (step % 3))
+    enforce_overlap([group], radius=100.0, rng=Random(1))
+    offsets = group.points.positions - group.center_position
+    expected = (offsets * offsets).mean(axis=0)
+    assert np.allclose(group.stats.spread(group.center_position), expected, rtol=1e-9)
+    assert np.allclose(group.stats.mean(), group.points.positions.mean(axis=0), rtol=1e-9)
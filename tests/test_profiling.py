@@ -0,0 +1,37 @@
+import json
+
+import pytest
+
+from app.logic import profiling
+from app.logic.profiling import Profiler
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.span("idle"):
+        pass
+    assert profiler.summary() == {}
+
+
+def test_rolling_percentiles_keep_the_latest_window(tmp_path):
+    profiler = Profiler(enabled=True, window=4)
+    for milliseconds in (100, 1, 2, 3, 4):
+        profiler.record("stage", milliseconds / 1000.0)
+    summary = profiler.summary()["stage"]
+    assert summary["count"] == 5
+    assert summary["max_ms"] == pytest.approx(4.0)
+    assert summary["p50_ms"] == pytest.approx(2.5)
+    assert summary["last_ms"] == pytest.approx(4.0)
+    profiler.dump(tmp_path / "perf.json")
+    assert json.loads((tmp_path / "perf.json").read_text())["spans"]["stage"]["count"] == 5
+
+
+def test_state_manager_stages_are_timed(monkeypatch, build_manager):
+    monkeypatch.setattr(profiling, "PROFILER", Profiler(enabled=True))
+    manager = build_manager(1)
+    manager.move_group("red", (5.0, 5.0))
+    manager.compute_kmeans()
+    manager.apply_kmeans()
+    recorded = profiling.PROFILER.summary()
+    for name in ("state.move_group", "kmeans.snapshot", "kmeans.run", "kmeans.metrics", "state.apply_kmeans"):
+        assert recorded[name]["count"] == 1
@@ -0,0 +1,35 @@
+import threading
+
+from app.logic.screenshot_service import BLOCK, ScreenshotWriter
+
+
+class FakeImage:
+    def __init__(self, gate: threading.Event | None = None) -> None:
+        self.gate = gate
+
+    def save(self, path: str, fmt: str, quality: int) -> bool:
+        if self.gate is not None:
+            self.gate.wait(5)
+        with open(path, "wb") as handle:
+            handle.write(fmt.encode())
+        return True
+
+
+def test_rapid_submissions_get_distinct_files(tmp_path):
+    writer = ScreenshotWriter(tmp_path, max_pending=16, policy=BLOCK, compression_level=9)
+    paths = [writer.submit(FakeImage()) for _ in range(10)]
+    writer.close()
+    assert len(set(paths)) == 10
+    assert all(path.exists() for path in paths)
+    assert writer.quality == 0
+
+
+def test_drop_oldest_keeps_queue_bounded(tmp_path):
+    gate = threading.Event()
+    writer = ScreenshotWriter(tmp_path, max_pending=2)
+    paths = [writer.submit(FakeImage(gate)) for _ in range(6)]
+    gate.set()
+    writer.close()
+    assert writer.dropped >= 3
+    assert writer.written + writer.dropped == 6
+    assert paths[-1].exists()